@@ -6,17 +6,65 @@ type information, allowing for better tracking and handling of different equatio
 in economic analysis (e.g., demand curves, supply curves).
 """
 
+import sympy as sp
+
+
+def substitute_values(expr, mapping):
+    """Substitute values into a SymPy object, using ``xreplace`` for plain symbol-to-number mappings.
+
+    ``xreplace`` skips the pattern matching ``subs`` does; other mappings go through ``subs``.
+    """
+    if all(isinstance(k, sp.Symbol) and isinstance(v, (int, float, sp.Number)) for k, v in mapping.items()):
+        return expr.xreplace({k: sp.sympify(v) for k, v in mapping.items()})
+    return expr.subs(mapping)
+
+
+# Shared TypedEquation instances, keyed by (equation, function_type)
+_INTERNED = {}
+
 
 class TypedEquation:
+    # Read-only: instances are interned and shared between market functions and results
+    __slots__ = ("_equation", "_function_type", "_free_symbols")
+
     def __init__(self, equation, function_type):
-        self.equation = equation
-        self.function_type = function_type
+        self._equation = equation
+        self._function_type = function_type
+        self._free_symbols = None
+
+    @property
+    def equation(self):
+        """The wrapped SymPy equation"""
+        return self._equation
+
+    @property
+    def function_type(self):
+        """The equation's type label, e.g. 'linear_demand'"""
+        return self._function_type
+
+    @classmethod
+    def get(cls, equation, function_type):
+        """Return the shared instance for an equation and type, creating it on first use"""
+        key = (equation, function_type)
+        interned = _INTERNED.get(key)
+        if interned is None:
+            interned = _INTERNED[key] = cls(equation, function_type)
+        return interned
 
     def subs(self, *args, **kwargs):
         """Preserve type information when substituting values"""
+        if len(args) == 1 and isinstance(args[0], dict) and not kwargs:
+            mapping, equation = args[0], self.equation
+            if isinstance(equation, sp.Eq) and isinstance(equation.lhs, sp.Symbol) and equation.lhs not in mapping:
+                # Only the right-hand side changes, so rebuild the relation without re-evaluating it
+                new_rhs = substitute_values(equation.rhs, mapping)
+                return TypedEquation(sp.Eq(equation.lhs, new_rhs, evaluate=False), self.function_type)
+            return TypedEquation(substitute_values(equation, mapping), self.function_type)
         return TypedEquation(self.equation.subs(*args, **kwargs), self.function_type)
 
     @property
     def free_symbols(self):
-        """Pass through to underlying equation's free_symbols"""
-        return self.equation.free_symbols
+        """Underlying equation's free_symbols, computed once per instance (frozen, as it is shared)"""
+        if self._free_symbols is None:
+            self._free_symbols = frozenset(self._equation.free_symbols)
+        return self._free_symbols
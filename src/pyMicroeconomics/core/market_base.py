@@ -1,30 +1,273 @@
 from __future__ import annotations
+import functools
+import numpy as np
 import sympy as sp
-from .equation_types import TypedEquation
+from .equation_types import TypedEquation, substitute_values
 from .symbols import p, q
-from typing import Dict, Union, Any
+from typing import Callable, Dict, Optional, Tuple, Union
+
+try:
+    import numba
+except ImportError:  # Optional dependency
+    numba = None
 
 ParameterValue = Union[float, int]
 ParameterDict = Dict[sp.Symbol, ParameterValue]
+CompiledFunction = Tuple[Tuple[sp.Symbol, ...], Callable[..., float]]
+FastEval = Tuple[Tuple[sp.Symbol, ...], Callable[..., float], Callable[..., float]]
+ArrayEval = Tuple[Tuple[sp.Symbol, ...], Callable[..., np.ndarray]]
+ParamsKey = Tuple[Tuple[sp.Symbol, type, ParameterValue], ...]
+
+# Symbols every market function equation must contain
+_REQUIRED_SYMBOLS = frozenset((p, q))
+
+
+def freeze_params(params: ParameterDict) -> ParamsKey:
+    """Freeze a parameter dict into a hashable, order-independent cache key.
+
+    Value types are part of the key: 1 and 1.0 compare and hash equal but solve and substitute differently.
+    """
+    return tuple((sym, type(val), val) for sym, val in sorted(params.items(), key=lambda kv: kv[0].name))
+
+
+def thaw_params(key: ParamsKey) -> ParameterDict:
+    """Recover the parameter dict from its cache key."""
+    return {sym: val for sym, _, val in key}
+
+
+@functools.lru_cache(maxsize=1024)
+def _has_required_symbols(equation: sp.Eq) -> bool:
+    """Check an equation contains price and quantity, walking each distinct equation once."""
+    return _REQUIRED_SYMBOLS <= equation.free_symbols
+
+
+@functools.lru_cache(maxsize=256)
+def solve_for_quantity(equation: sp.Eq) -> sp.Expr:
+    """Solve an equation for q, memoized so each distinct curve is solved once per process."""
+    if equation.lhs == q and q not in equation.rhs.free_symbols:
+        return equation.rhs  # Already written as q = f(p), as the built-in templates are
+    return sp.solve(equation, q)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def solve_for_price(equation: sp.Eq) -> sp.Expr:
+    """Solve an equation for p (the inverse curve), memoized per distinct curve."""
+    return sp.solve(equation, p)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def quantity_slope(equation: sp.Eq) -> sp.Expr:
+    """Differentiate the solved q(p) of an equation, memoized per distinct curve."""
+    expr = solve_for_quantity(equation)
+    if p not in expr.free_symbols:
+        return sp.S.Zero
+    return sp.diff(expr, p)
+
+
+@functools.lru_cache(maxsize=4096)
+def _substituted_slope(equation: sp.Eq, key: ParamsKey) -> sp.Expr:
+    """Symbolic dq/dp with parameter values substituted, memoized per curve and parameter set."""
+    return substitute_values(quantity_slope(equation), thaw_params(key))
+
+
+@functools.lru_cache(maxsize=512)
+def _lambdify_cached(equation: sp.Eq, kind: str, backend: str) -> CompiledFunction:
+    """Lambdify the solved q(p) or dq/dp of an equation, memoized per curve and backend.
+
+    Arguments are the price followed by the remaining symbols ordered by name. Common
+    subexpressions (e.g. a repeated exp(-b*p)) are computed once per call.
+    """
+    expr = solve_for_quantity(equation) if kind == "quantity" else quantity_slope(equation)
+    args = tuple(sorted(expr.free_symbols - {p}, key=str))
+    return args, sp.lambdify((p, *args), expr, backend, cse=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _jit_cached(equation: sp.Eq) -> Callable[..., float]:
+    """Numba-compile the q(p) of an equation once per process."""
+    _, func = _lambdify_cached(equation, "quantity", "math")
+    return numba.njit(func)
+
+
+# Hand-written numeric (quantity, slope) functions keyed by (function_type, equation)
+_FAST_EVAL: Dict[Tuple[str, sp.Eq], FastEval] = {}
+# NumPy counterparts of the quantity functions, for array prices
+_ARRAY_EVAL: Dict[Tuple[str, sp.Eq], ArrayEval] = {}
+
+
+def register_fast_eval(
+    function_type: str,
+    equation: sp.Eq,
+    params: Tuple[sp.Symbol, ...],
+    quantity: Callable[..., float],
+    slope: Callable[..., float],
+    array_quantity: Optional[Callable[..., np.ndarray]] = None,
+) -> None:
+    """Register plain-Python quantity and slope functions for a known equation.
+
+    Both functions take the price followed by the values of ``params``. They are only used
+    for market functions whose type and equation match exactly. ``array_quantity`` is the
+    version used for price arrays; it defaults to ``quantity``, which must then accept arrays.
+    """
+    _FAST_EVAL[(function_type, equation)] = (params, quantity, slope)
+    _ARRAY_EVAL[(function_type, equation)] = (params, array_quantity or quantity)
+
+
+def array_quantity_function(function_type: str, equation: sp.Eq) -> Optional[ArrayEval]:
+    """Get the registered NumPy quantity function and its parameter order for a known equation."""
+    return _ARRAY_EVAL.get((function_type, equation))
 
 
 class MarketFunction:
     """Base class for market functions (supply and demand)."""
 
-    def __init__(self, equation: TypedEquation, function_type: str):
+    def __init__(self, equation: TypedEquation, function_type: str, parameters: Optional[ParameterDict] = None):
         self.equation = equation
         self.function_type = function_type
+        self.parameters: ParameterDict = dict(parameters or {})
+        # Solved q(p) and dq/dp, computed lazily and reused across calls
+        self._q_expr: Optional[sp.Expr] = None
+        self._dq_dp: Optional[sp.Expr] = None
+        # Numeric callables compiled from the expressions above, keyed by (kind, backend)
+        self._lambdified: Dict[Tuple[str, str], CompiledFunction] = {}
+        self._jitted: Optional[Callable[..., float]] = None
         self._validate_equation()
+        self._fast_eval = _FAST_EVAL.get((function_type, equation.equation))
+        self._array_eval = _ARRAY_EVAL.get((function_type, equation.equation))
 
     def _validate_equation(self) -> None:
         """Validate that equation contains required symbols."""
         if not isinstance(self.equation, TypedEquation):
             raise ValueError("Equation must be a TypedEquation instance")
-        symbols = self.equation.free_symbols
-        if not (p in symbols and q in symbols):
+        if not _has_required_symbols(self.equation.equation):
             raise ValueError("Equation must contain both price (p) and quantity (q) symbols")
 
-    def get_slope(self) -> sp.Expr:
-        """Get symbolic slope of the function."""
-        expr = sp.solve(self.equation.equation, q)[0]
-        return sp.diff(expr, p)
+    def _slope_expr(self) -> sp.Expr:
+        """Get dq/dp, differentiating only once."""
+        if self._dq_dp is None:
+            self._dq_dp = quantity_slope(self.equation.equation)
+        return self._dq_dp
+
+    def _merge_params(self, params: Optional[ParameterDict]) -> ParameterDict:
+        """Combine stored parameters with call-time overrides."""
+        if not params:
+            return self.parameters
+        return {**self.parameters, **params}
+
+    def _compiled(self, kind: str, backend: str = "math") -> CompiledFunction:
+        """Get the lambdified quantity or slope function, compiling it on first use."""
+        key = (kind, backend)
+        if key not in self._lambdified:
+            # Populate the instance's solved expressions; the compiled function itself is shared
+            if kind == "quantity":
+                self.get_quantity_expr()
+            else:
+                self._slope_expr()
+            self._lambdified[key] = _lambdify_cached(self.equation.equation, kind, backend)
+        return self._lambdified[key]
+
+    @staticmethod
+    def _param_values(args: Tuple[sp.Symbol, ...], params: ParameterDict) -> Tuple[ParameterValue, ...]:
+        """Order parameter values to match a compiled function's signature."""
+        try:
+            return tuple(map(params.__getitem__, args))
+        except KeyError:
+            missing = [str(s) for s in args if s not in params]
+            raise ValueError(f"Missing parameter values for symbols: {missing}")
+
+    def _numeric(self, kind: str, price: ParameterValue, params: ParameterDict) -> float:
+        """Evaluate the quantity or slope function at a price, using the fast path if registered."""
+        if self._fast_eval is not None:
+            args, quantity, slope = self._fast_eval
+            func = quantity if kind == "quantity" else slope
+        else:
+            args, func = self._compiled(kind)
+        values = self._param_values(args, params)
+        try:
+            return float(func(price, *values))
+        except (TypeError, ZeroDivisionError, OverflowError):
+            raise ValueError(f"Could not evaluate {self.function_type} at price {price}")
+
+    def substitute_params(self, params: ParameterDict) -> MarketFunction:
+        """Return a new market function with parameter values substituted.
+
+        The symbolic equation is shared rather than rewritten; values are applied at evaluation time.
+        """
+        new_func = self.__class__(self.equation, self.function_type, self._merge_params(params))
+        # Same equation, so solved and compiled expressions carry over
+        new_func._q_expr = self._q_expr
+        new_func._dq_dp = self._dq_dp
+        new_func._lambdified = self._lambdified
+        new_func._jitted = self._jitted
+        return new_func
+
+    def evaluate(self, price: ParameterValue, params: Optional[ParameterDict] = None) -> float:
+        """Evaluate quantity at the given price; use ``evaluate_array`` for arrays of prices."""
+        if price < 0:
+            raise ValueError("Price cannot be negative")
+        all_params = self._merge_params(params)
+        quantity = self._numeric("quantity", price, all_params)
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative")
+        return quantity
+
+    def evaluate_array(self, prices: np.ndarray, params: Optional[ParameterDict] = None) -> np.ndarray:
+        """Evaluate quantity at an array of prices in one vectorized call.
+
+        Unlike ``evaluate``, negative quantities do not raise; they are returned as NaN.
+        """
+        prices = np.asarray(prices, dtype=float)
+        if np.any(prices < 0):
+            raise ValueError("Price cannot be negative")
+        args, func = self._array_eval or self._compiled("quantity", "numpy")
+        values = self._param_values(args, self._merge_params(params))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            quantities = np.broadcast_to(np.asarray(func(prices, *values), dtype=float), prices.shape).copy()
+            quantities[quantities < 0] = np.nan
+        return quantities
+
+    def jit(self) -> Callable[..., float]:
+        """Compile q(p) with Numba.
+
+        The returned function takes the price followed by parameter values ordered by symbol name.
+        """
+        if numba is None:
+            raise ImportError("MarketFunction.jit requires numba: pip install pyMicroeconomics[jit]")
+        if self._jitted is None:
+            self._jitted = _jit_cached(self.equation.equation)
+        return self._jitted
+
+    def jitted_evaluate(self, price: ParameterValue, params: Optional[ParameterDict] = None) -> float:
+        """Evaluate quantity at the given price using the Numba-compiled function."""
+        if price < 0:
+            raise ValueError("Price cannot be negative")
+        args, _ = self._compiled("quantity")
+        quantity = float(self.jit()(float(price), *map(float, self._param_values(args, self._merge_params(params)))))
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative")
+        return quantity
+
+    def get_quantity_expr(self) -> sp.Expr:
+        """Get quantity as a function of price, solving the equation only once."""
+        if self._q_expr is None:
+            self._q_expr = solve_for_quantity(self.equation.equation)
+        return self._q_expr
+
+    def get_slope(
+        self, price: Union[ParameterValue, np.ndarray, None] = None, params: Optional[ParameterDict] = None
+    ) -> Union[sp.Expr, float, np.ndarray]:
+        """Get slope dq/dp, symbolically or evaluated at a price or array of prices."""
+        all_params = self._merge_params(params)
+        if price is None:
+            if not all_params:
+                return self._slope_expr()
+            try:
+                return _substituted_slope(self.equation.equation, freeze_params(all_params))
+            except TypeError:  # Unhashable parameter values
+                return substitute_values(self._slope_expr(), all_params)
+        if np.ndim(price) > 0:
+            prices = np.asarray(price, dtype=float)
+            args, func = self._compiled("slope", "numpy")
+            slopes = func(prices, *self._param_values(args, all_params))
+            return np.broadcast_to(np.asarray(slopes, dtype=float), prices.shape).copy()
+        return self._numeric("slope", price, all_params)
@@ -2,7 +2,7 @@
 
 from .demand import linear_demand, power_demand, exponential_demand, quadratic_demand
 from .supply import linear_supply, power_supply, exponential_supply, quadratic_supply
-from .equilibrium.main import market_equilibrium
+from .equilibrium.main import market_equilibrium, market_equilibrium_batch
 
 __all__ = [
     "linear_demand",
@@ -14,4 +14,5 @@ __all__ = [
     "exponential_supply",
     "quadratic_supply",
     "market_equilibrium",
+    "market_equilibrium_batch",
 ]
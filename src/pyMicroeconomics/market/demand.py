@@ -1,29 +1,78 @@
 from __future__ import annotations
+import math
+import numpy as np
 import sympy as sp
-from ..core.market_base import MarketFunction
+from typing import Dict, Optional
+from ..core.market_base import MarketFunction, ParameterDict, ParameterValue, register_fast_eval
 from ..core.equation_types import TypedEquation
 from ..core.symbols import p, q, a, b
 
+# Symbolic demand equations, built once and shared by every factory call
+_EQUATION_TEMPLATES: Dict[str, sp.Eq] = {
+    "linear_demand": sp.Eq(q, a - b * p),
+    "power_demand": sp.Eq(q, a * p**b),
+    "exponential_demand": sp.Eq(q, sp.exp(-a * p + b)),
+    "quadratic_demand": sp.Eq(q, a - b * p**2),
+}
 
-def linear_demand() -> MarketFunction:
+
+def _demand(name: str, a_param: Optional[ParameterValue], b_param: Optional[ParameterValue]) -> MarketFunction:
+    """Build a demand function from its template, storing any given parameter values."""
+    params: ParameterDict = {sym: val for sym, val in ((a, a_param), (b, b_param)) if val is not None}
+    return MarketFunction(TypedEquation.get(_EQUATION_TEMPLATES[name], name), name, params)
+
+
+def linear_demand(a_param: Optional[ParameterValue] = None, b_param: Optional[ParameterValue] = None) -> MarketFunction:
     """Create linear demand curve equation: q = a - b*p"""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "linear_demand")
-    return MarketFunction(eq, "linear_demand")
+    return _demand("linear_demand", a_param, b_param)
 
 
-def power_demand() -> MarketFunction:
+def power_demand(a_param: Optional[ParameterValue] = None, b_param: Optional[ParameterValue] = None) -> MarketFunction:
     """Create power demand curve equation: q = a*p^b"""
-    eq = TypedEquation(sp.Eq(q, a * p**b), "power_demand")
-    return MarketFunction(eq, "power_demand")
+    return _demand("power_demand", a_param, b_param)
 
 
-def exponential_demand() -> MarketFunction:
+def exponential_demand(
+    a_param: Optional[ParameterValue] = None, b_param: Optional[ParameterValue] = None
+) -> MarketFunction:
     """Create exponential demand curve equation: q = exp(-a*p + b)"""
-    eq = TypedEquation(sp.Eq(q, sp.exp(-a * p + b)), "exponential_demand")
-    return MarketFunction(eq, "exponential_demand")
+    return _demand("exponential_demand", a_param, b_param)
 
 
-def quadratic_demand() -> MarketFunction:
+def quadratic_demand(
+    a_param: Optional[ParameterValue] = None, b_param: Optional[ParameterValue] = None
+) -> MarketFunction:
     """Create quadratic demand curve equation: q = a - b*p^2"""
-    eq = TypedEquation(sp.Eq(q, a - b * p**2), "quadratic_demand")
-    return MarketFunction(eq, "quadratic_demand")
+    return _demand("quadratic_demand", a_param, b_param)
+
+
+# Plain-Python evaluators for the built-in curves, bypassing SymPy on the scalar and array paths
+register_fast_eval(
+    "linear_demand",
+    _EQUATION_TEMPLATES["linear_demand"],
+    (a, b),
+    lambda price, a_val, b_val: a_val - b_val * price,
+    lambda price, a_val, b_val: -b_val,
+)
+register_fast_eval(
+    "power_demand",
+    _EQUATION_TEMPLATES["power_demand"],
+    (a, b),
+    lambda price, a_val, b_val: a_val * price**b_val,
+    lambda price, a_val, b_val: a_val * b_val * price ** (b_val - 1),
+)
+register_fast_eval(
+    "exponential_demand",
+    _EQUATION_TEMPLATES["exponential_demand"],
+    (a, b),
+    lambda price, a_val, b_val: math.exp(-a_val * price + b_val),
+    lambda price, a_val, b_val: -a_val * math.exp(-a_val * price + b_val),
+    lambda price, a_val, b_val: np.exp(-a_val * price + b_val),
+)
+register_fast_eval(
+    "quadratic_demand",
+    _EQUATION_TEMPLATES["quadratic_demand"],
+    (a, b),
+    lambda price, a_val, b_val: a_val - b_val * price**2,
+    lambda price, a_val, b_val: -2 * b_val * price,
+)
@@ -1,8 +1,17 @@
 """Market equilibrium package."""
 
-from .main import market_equilibrium
-from .types import EquilibriumResult
+from .main import market_equilibrium, market_equilibrium_batch
+from .types import CompiledEquilibrium, EquilibriumResult
 from .solver import solve_equilibrium
 from .surplus import calculate_surpluses
+from .compiled import compile_equilibrium
 
-__all__ = ["market_equilibrium", "EquilibriumResult", "solve_equilibrium", "calculate_surpluses"]
+__all__ = [
+    "market_equilibrium",
+    "market_equilibrium_batch",
+    "EquilibriumResult",
+    "CompiledEquilibrium",
+    "solve_equilibrium",
+    "calculate_surpluses",
+    "compile_equilibrium",
+]
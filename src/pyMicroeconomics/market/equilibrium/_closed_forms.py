@@ -0,0 +1,110 @@
+"""
+Closed-form equilibrium prices and surpluses for the built-in curve families.
+
+Each surplus entry pairs a pattern for q(p) with a formula for the surplus at the equilibrium
+point, derived from integrating the inverse curve from 0 to the equilibrium quantity.
+Price entries pair a demand and a supply pattern with the price that equates them.
+Matching the pattern recovers the curve coefficients whether they are symbols or numbers.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Optional, Tuple
+import sympy as sp
+from ...core.symbols import p
+
+A = sp.Wild("A", exclude=[p])
+B = sp.Wild("B", exclude=[p])
+K = sp.Wild("K", exclude=[p])
+
+SurplusFormula = Callable[[sp.Expr, sp.Expr, sp.Expr, sp.Expr], sp.Expr]
+ClosedForm = Tuple[sp.Expr, SurplusFormula]
+PriceFormula = Callable[[sp.Expr, sp.Expr, sp.Expr, sp.Expr], sp.Expr]
+
+# Equilibrium price from demand coefficients (a, b) and supply coefficients (c, d)
+PRICE_FORMULAS: Dict[Tuple[str, str], Tuple[sp.Expr, sp.Expr, PriceFormula]] = {
+    ("linear_demand", "linear_supply"): (A - B * p, A + B * p, lambda a, b, c, d: (a - c) / (b + d)),
+    ("power_demand", "power_supply"): (A * p**B, A * p**B, lambda a, b, c, d: (c / a) ** (1 / (b - d))),
+    ("exponential_demand", "exponential_supply"): (
+        sp.exp(-A * p + B),
+        sp.exp(A * p + B),
+        lambda a, b, c, d: (b - d) / (a + c),
+    ),
+}
+
+# Consumer surplus: integral of inverse demand over [0, q_eq] minus p_eq * q_eq
+CS_FORMULAS: Dict[str, ClosedForm] = {
+    "linear_demand": (A - B * p, lambda a, b, p_eq, q_eq: (a * q_eq - q_eq**2 / 2) / b - p_eq * q_eq),
+    "power_demand": (A * p**B, lambda a, b, p_eq, q_eq: q_eq * (q_eq / a) ** (1 / b) * b / (b + 1) - p_eq * q_eq),
+    "exponential_demand": (
+        sp.exp(-A * p + B),
+        lambda a, b, p_eq, q_eq: q_eq * (b - sp.log(q_eq) + 1) / a - p_eq * q_eq,
+    ),
+    "quadratic_demand": (
+        A - B * p**2,
+        lambda a, b, p_eq, q_eq: 2 * (a ** sp.Rational(3, 2) - (a - q_eq) ** sp.Rational(3, 2)) / (3 * sp.sqrt(b))
+        - p_eq * q_eq,
+    ),
+}
+
+# Producer surplus: p_eq * q_eq minus integral of inverse supply over [0, q_eq]
+PS_FORMULAS: Dict[str, ClosedForm] = {
+    "linear_supply": (A + B * p, lambda c, d, p_eq, q_eq: p_eq * q_eq - (q_eq**2 / 2 - c * q_eq) / d),
+    "power_supply": (A * p**B, lambda c, d, p_eq, q_eq: p_eq * q_eq - q_eq * (q_eq / c) ** (1 / d) * d / (d + 1)),
+    "exponential_supply": (
+        sp.exp(A * p + B),
+        lambda c, d, p_eq, q_eq: p_eq * q_eq - q_eq * (sp.log(q_eq) - 1 - d) / c,
+    ),
+    "quadratic_supply": (
+        A + B * p**2,
+        lambda c, d, p_eq, q_eq: p_eq * q_eq
+        - 2 * ((q_eq - c) ** sp.Rational(3, 2) - (-c) ** sp.Rational(3, 2)) / (3 * sp.sqrt(d)),
+    ),
+}
+
+
+def _coefficients(q_expr: sp.Expr, pattern: sp.Expr) -> Optional[Tuple[sp.Expr, sp.Expr]]:
+    """Match q(p) against a pattern, returning its two coefficients.
+
+    SymPy pulls numeric constants out of exponentials (exp(2.5 - p) becomes 12.18*exp(-p)),
+    so exponential patterns are retried with the constant as a factor.
+    """
+    match = q_expr.match(pattern)
+    if match and A in match and B in match:
+        return match[A], match[B]
+    if isinstance(pattern, sp.exp):
+        match = q_expr.match(K * pattern.xreplace({B: 0}))
+        if match and A in match and K in match and match[K].is_positive:
+            return match[A], sp.log(match[K])
+    return None
+
+
+def closed_form_surplus(
+    table: Dict[str, ClosedForm], function_type: str, q_expr: sp.Expr, eq_price: sp.Expr, eq_quantity: sp.Expr
+) -> Optional[sp.Expr]:
+    """Evaluate a tabulated surplus formula, or return None when no formula applies."""
+    entry = table.get(function_type)
+    if entry is None:
+        return None
+    pattern, formula = entry
+    coeffs = _coefficients(q_expr, pattern)
+    if coeffs is None:
+        return None
+    return formula(*coeffs, eq_price, eq_quantity)
+
+
+def closed_form_price(
+    demand_type: str, supply_type: str, demand_expr: sp.Expr, supply_expr: sp.Expr
+) -> Optional[sp.Expr]:
+    """Evaluate a tabulated equilibrium price, or return None when no finite formula applies."""
+    entry = PRICE_FORMULAS.get((demand_type, supply_type))
+    if entry is None:
+        return None
+    demand_pattern, supply_pattern, formula = entry
+    demand_coeffs = _coefficients(demand_expr, demand_pattern)
+    supply_coeffs = _coefficients(supply_expr, supply_pattern)
+    if demand_coeffs is None or supply_coeffs is None:
+        return None
+    price = formula(*demand_coeffs, *supply_coeffs)
+    if price.has(sp.zoo, sp.oo, -sp.oo, sp.nan):
+        return None  # Parallel curves: no single crossing
+    return price
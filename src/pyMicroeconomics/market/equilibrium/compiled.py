@@ -0,0 +1,50 @@
+from __future__ import annotations
+import functools
+import numpy as np
+import sympy as sp
+from typing import Optional, Sequence, Tuple
+from .types import CompiledEquilibrium, EquilibriumResult
+
+# Result entries that are scalar functions of the model parameters
+VALUE_KEYS = (
+    "Equilibrium_Price",
+    "Equilibrium_Quantity",
+    "Consumer_Surplus",
+    "Producer_Surplus",
+    "Total_Surplus",
+)
+
+
+def real_values(values: Sequence[complex]) -> np.ndarray:
+    """Real parts of evaluated expressions; values with a non-negligible imaginary part become NaN.
+
+    SciPy's special functions (e.g. ``lambertw``) return complex arrays even for real results.
+    """
+    values = np.asarray(values)
+    if not np.iscomplexobj(values):
+        return values.astype(float)
+    return np.where(np.isclose(values.imag, 0.0), values.real, np.nan)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_cached(keys: Tuple[str, ...], exprs: Tuple[sp.Expr, ...]) -> CompiledEquilibrium:
+    """Lambdify expressions over their combined free symbols."""
+    symbols = tuple(sorted(set().union(*(expr.free_symbols for expr in exprs)), key=str))
+    # Default modules put SciPy ahead of NumPy, so special functions such as LambertW evaluate
+    functions = {key: sp.lambdify(symbols, expr, cse=True) for key, expr in zip(keys, exprs)}
+    return CompiledEquilibrium(symbols, functions)
+
+
+def _is_finite_expr(value: Optional[sp.Expr]) -> bool:
+    """Check that a result value is a usable symbolic expression."""
+    return isinstance(value, sp.Expr) and not value.has(sp.oo, -sp.oo, sp.zoo, sp.nan)
+
+
+def compile_equilibrium(result: EquilibriumResult) -> CompiledEquilibrium:
+    """Compile the numeric values of an equilibrium result into NumPy callables.
+
+    Every function takes the parameter values positionally in the order of ``symbols``.
+    Compilation uses common subexpression elimination and is cached per expression set.
+    """
+    keys = tuple(key for key in VALUE_KEYS if _is_finite_expr(result.get(key)))
+    return _compile_cached(keys, tuple(result[key] for key in keys))
@@ -1,40 +1,230 @@
 from __future__ import annotations
+import functools
+import numpy as np
 import sympy as sp
-from typing import Optional
-from ...core.market_base import MarketFunction
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union, cast
+from ...core.equation_types import TypedEquation
+from ...core.market_base import MarketFunction, ParameterDict, ParameterValue, ParamsKey, freeze_params, thaw_params
 from .types import EquilibriumResult
 from .solver import solve_equilibrium
 from .surplus import calculate_surpluses
+from .compiled import compile_equilibrium, real_values
 
+FunctionKey = Tuple[sp.Eq, str, str]
 
-def market_equilibrium(demand: MarketFunction, supply: MarketFunction) -> Optional[EquilibriumResult]:
-    """Calculate market equilibrium and associated surpluses."""
+
+def _function_key(func: MarketFunction) -> FunctionKey:
+    """Hashable description of a market function for caching."""
+    return func.equation.equation, func.equation.function_type, func.function_type
+
+
+def _exact_params(params: ParameterDict, demand_type: str, supply_type: str) -> ParameterDict:
+    """Convert float parameter values to Rationals when both curves are linear.
+
+    Linear equilibria and surpluses then stay exact rationals, which ``float()`` converts directly.
+    Other families are left alone, since exact roots there grow into nested radicals.
+    """
+    if not (demand_type.startswith("linear_") and supply_type.startswith("linear_")):
+        return params
+    return {sym: sp.nsimplify(val, rational=True) if isinstance(val, float) else val for sym, val in params.items()}
+
+
+def _rebuild(key: FunctionKey, params: ParameterDict) -> MarketFunction:
+    """Recreate a market function from its cache key, substituting parameters."""
+    equation, equation_type, function_type = key
+    typed_eq = TypedEquation(equation, equation_type)
+    if params:
+        typed_eq = typed_eq.subs(params)
+    return MarketFunction(typed_eq, function_type)
+
+
+SURPLUS_KEYS = ("Consumer_Surplus", "Producer_Surplus", "Total_Surplus")
+SurplusDict = Dict[str, Optional[sp.Expr]]
+
+
+class _LazyEquilibriumResult(dict):
+    """Equilibrium result whose surplus entries are computed on first access.
+
+    Reading a surplus key triggers the computation once; every other dict method
+    resolves first, so the mapping always behaves as if the surpluses were present.
+    """
+
+    def __init__(self, values: Dict[str, Any], compute_surpluses: Callable[[], SurplusDict]):
+        super().__init__(values)
+        self._compute_surpluses: Optional[Callable[[], SurplusDict]] = compute_surpluses
+
+    def _resolve(self) -> None:
+        """Fill in the surplus entries if they have not been computed yet."""
+        if self._compute_surpluses is not None:
+            compute, self._compute_surpluses = self._compute_surpluses, None
+            for key, value in compute().items():
+                super().setdefault(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in SURPLUS_KEYS:
+            self._resolve()
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in SURPLUS_KEYS:
+            self._resolve()
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or (self._compute_surpluses is not None and key in SURPLUS_KEYS)
+
+    def __eq__(self, other: object) -> bool:
+        self._resolve()
+        if isinstance(other, _LazyEquilibriumResult):
+            other._resolve()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _resolving(name: str) -> Callable[..., Any]:
+    """Wrap a dict method so it resolves the lazy surpluses before running."""
+    method = getattr(dict, name)
+
+    @functools.wraps(method)
+    def wrapper(self: _LazyEquilibriumResult, *args: Any, **kwargs: Any) -> Any:
+        self._resolve()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in (
+    "__iter__",
+    "__reversed__",
+    "__len__",
+    "__repr__",
+    "__delitem__",
+    "__or__",
+    "__ror__",
+    "__ior__",
+    "keys",
+    "values",
+    "items",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "clear",
+    "copy",
+):
+    setattr(_LazyEquilibriumResult, _name, _resolving(_name))
+
+
+@functools.lru_cache(maxsize=256)
+def _solve_cached(
+    demand_key: FunctionKey, supply_key: FunctionKey, params_key: ParamsKey
+) -> Optional[Tuple[sp.Expr, sp.Expr, sp.Expr]]:
+    """Cached equilibrium price, quantity and inverse demand on hashable inputs."""
+    params = thaw_params(params_key)
+    return solve_equilibrium(_rebuild(demand_key, params), _rebuild(supply_key, params))
+
+
+@functools.lru_cache(maxsize=256)
+def _surpluses_cached(demand_key: FunctionKey, supply_key: FunctionKey, params_key: ParamsKey) -> SurplusDict:
+    """Cached consumer, producer and total surplus on hashable inputs."""
+    equilibrium = _solve_cached(demand_key, supply_key, params_key)
+    if equilibrium is None:
+        return {key: None for key in SURPLUS_KEYS}
+    params = thaw_params(params_key)
+    eq_price, eq_quantity, inverse_demand = equilibrium
+    return calculate_surpluses(
+        _rebuild(demand_key, params), _rebuild(supply_key, params), eq_price, eq_quantity, inverse_demand
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _equilibrium_cached(
+    demand_key: FunctionKey, supply_key: FunctionKey, params_key: ParamsKey
+) -> Optional[Tuple[Dict[str, Any], ParamsKey]]:
+    """Cached equilibrium entries on the caller's hashable inputs.
+
+    Also returns the parameter key the solve used, which differs when floats were made exact.
+    """
+    params = _exact_params(thaw_params(params_key), demand_key[2], supply_key[2])
+    solve_key = freeze_params(params)
+    equilibrium = _solve_cached(demand_key, supply_key, solve_key)
+    if equilibrium is None:
+        return None
+
+    eq_price, eq_quantity, inverse_demand = equilibrium
+    demand_eq, supply_eq = (TypedEquation.get(*key[:2]) for key in (demand_key, supply_key))
+    values = {
+        "Equilibrium_Price": eq_price,
+        "Equilibrium_Quantity": eq_quantity,
+        "Demand_Equation": demand_eq.subs(params) if params else demand_eq,
+        "Supply_Equation": supply_eq.subs(params) if params else supply_eq,
+        "Inverse_Demand_Function": inverse_demand,  # Now included
+        "Demand_Type": demand_key[2],
+        "Supply_Type": supply_key[2],
+    }
+    return values, solve_key
+
+
+def market_equilibrium(
+    demand: MarketFunction, supply: MarketFunction, parameter_subs: Optional[ParameterDict] = None
+) -> Optional[EquilibriumResult]:
+    """Calculate market equilibrium and associated surpluses.
+
+    Parameters stored on the market functions are combined with ``parameter_subs``.
+    Results are memoized, so repeated calls with the same inputs are a cache lookup.
+    Surpluses are only computed once one of them is accessed.
+    """
     try:
-        # Solve for equilibrium
-        equilibrium = solve_equilibrium(demand, supply)
-        if equilibrium is None:
-            return None
+        params = {**demand.parameters, **supply.parameters, **(parameter_subs or {})}
+        demand_key, supply_key = _function_key(demand), _function_key(supply)
 
-        eq_price, eq_quantity, inverse_demand = equilibrium
-
-        # Calculate surpluses
-        surpluses = calculate_surpluses(demand, supply, eq_price, eq_quantity)
-
-        # Create result
-        result: EquilibriumResult = {
-            "Equilibrium_Price": eq_price,
-            "Equilibrium_Quantity": eq_quantity,
-            "Consumer_Surplus": surpluses["Consumer_Surplus"],
-            "Producer_Surplus": surpluses["Producer_Surplus"],
-            "Total_Surplus": surpluses["Total_Surplus"],
-            "Demand_Equation": demand.equation,
-            "Supply_Equation": supply.equation,
-            "Inverse_Demand_Function": inverse_demand,  # Now included
-            "Demand_Type": demand.function_type,
-            "Supply_Type": supply.function_type,
-        }
+        cached = _equilibrium_cached(demand_key, supply_key, freeze_params(params))
+        if cached is None:
+            return None
+        values, solve_key = cached
 
-        return result
+        # Each call gets a fresh dict so callers can't mutate cached entries
+        result = _LazyEquilibriumResult(values, lambda: _surpluses_cached(demand_key, supply_key, solve_key))
+        return cast(EquilibriumResult, result)
 
     except Exception as e:
         raise ValueError(f"Error calculating market equilibrium: {str(e)}")
+
+
+def market_equilibrium_batch(
+    demand: MarketFunction,
+    supply: MarketFunction,
+    param_grid: Dict[sp.Symbol, Union[ParameterValue, Sequence[ParameterValue], np.ndarray]],
+) -> Dict[str, np.ndarray]:
+    """Evaluate equilibrium values over the Cartesian product of parameter values.
+
+    The symbolic equilibrium is solved once and compiled, then evaluated with NumPy broadcasting.
+    Each returned array has one axis per entry of ``param_grid``, in insertion order; a scalar value gives
+    an axis of length one.
+    """
+    result = market_equilibrium(demand, supply)
+    if result is None:
+        raise ValueError("No equilibrium found for the given market functions")
+
+    compiled = compile_equilibrium(result)
+    missing = [str(sym) for sym in compiled.symbols if sym not in param_grid]
+    if missing:
+        raise ValueError(f"Missing parameter values for symbols: {missing}")
+    unknown = [str(sym) for sym in param_grid if sym not in compiled.symbols]
+    if unknown:
+        raise ValueError(f"Grid values given for symbols that are bound or not in the model: {unknown}")
+
+    axes = [np.atleast_1d(np.asarray(values, dtype=float)) for values in param_grid.values()]
+    grids = dict(zip(param_grid, np.meshgrid(*axes, indexing="ij")))
+    shape = tuple(len(axis) for axis in axes)  # () for an empty grid: every parameter is bound
+    args = [grids[sym] for sym in compiled.symbols]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return {
+            key: np.broadcast_to(real_values(func(*args)), shape).copy()
+            for key, func in compiled.functions.items()
+        }
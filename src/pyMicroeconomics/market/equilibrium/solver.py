@@ -1,8 +1,59 @@
 from __future__ import annotations
 import sympy as sp
-from typing import Optional, Tuple, Union
-from ...core.market_base import MarketFunction
+from typing import List, Optional, Tuple, Union
+from ...core.market_base import MarketFunction, solve_for_price
 from ...core.symbols import p, q
+from ._closed_forms import closed_form_price
+
+
+POLYNOMIAL_PREFIXES = ("linear_", "quadratic_")
+
+
+def targeted_simplify(expr: sp.Expr, demand_type: str, supply_type: str) -> sp.Expr:
+    """Canonicalize an equilibrium expression, avoiding sp.simplify for polynomial curve families."""
+    is_polynomial_pair = demand_type.startswith(POLYNOMIAL_PREFIXES) and supply_type.startswith(POLYNOMIAL_PREFIXES)
+    if is_polynomial_pair and expr.is_rational_function(*expr.free_symbols):
+        return sp.cancel(sp.expand(expr))
+    return sp.simplify(expr)
+
+
+def _assume_real_radicals(expr: sp.Expr) -> sp.Expr:
+    """Treat square roots as positive reals, as they must be for a real equilibrium."""
+    return expr.replace(lambda e: e.is_Pow and e.exp == sp.S.Half, lambda e: sp.Dummy(positive=True))
+
+
+def _select_price(solutions: List[sp.Expr]) -> sp.Expr:
+    """Pick the economically meaningful (positive, real) root when it can be determined."""
+    positive = [s for s in solutions if s.is_positive]
+    if positive:
+        # Numeric roots: the smallest positive price clears the market first
+        return min(positive) if all(s.is_number for s in positive) else positive[0]
+    plausible = [s for s in solutions if s.is_real is not False and not _assume_real_radicals(s).is_negative]
+    if plausible:
+        return plausible[0]
+    return solutions[0]
+
+
+def _solve_equilibrium_system(demand_type: str, supply_type: str, excess_demand: sp.Expr) -> List[sp.Expr]:
+    """Solve excess demand = 0 for price, reading the root off the coefficients when both curves are linear."""
+    if demand_type.startswith("linear_") and supply_type.startswith("linear_"):
+        try:
+            poly = sp.Poly(excess_demand, p)
+        except sp.PolynomialError:
+            poly = None  # Not actually linear in p, use the general solver
+        if poly is not None and poly.degree() <= 1:
+            if poly.degree() < 1:
+                return []  # Parallel curves
+            slope, intercept = poly.all_coeffs()
+            return [-intercept / slope]
+    if demand_type.startswith(POLYNOMIAL_PREFIXES) and supply_type.startswith(POLYNOMIAL_PREFIXES):
+        try:
+            roots = sp.roots(sp.Poly(excess_demand, p))
+            if roots:
+                return list(roots)
+        except sp.PolynomialError:
+            pass  # Not a polynomial in p, use the general solver
+    return sp.solve(excess_demand, p)
 
 
 def solve_equilibrium(
@@ -10,27 +61,29 @@ def solve_equilibrium(
 ) -> Optional[Tuple[sp.Expr, sp.Expr, Union[sp.Eq, sp.Rel]]]:
     """Solve for market equilibrium price and quantity symbolically."""
     try:
-        # Get demand and supply expressions
-        demand_expr = sp.solve(demand.equation.equation, q)[0]
-        supply_expr = sp.solve(supply.equation.equation, q)[0]
-
-        # Calculate inverse demand function as an equation
-        inverse_demand_rhs = sp.solve(sp.Eq(q, demand_expr), p)[0]
-        # Don't wrap in Eq(), just return the expression
-        inverse_demand = inverse_demand_rhs
+        # Get demand and supply expressions (solved once per market function)
+        demand_expr = demand.get_quantity_expr()
+        supply_expr = supply.get_quantity_expr()
 
-        # Create equilibrium equation by setting demand = supply
-        eq = sp.Eq(demand_expr, supply_expr)
+        # Inverse demand comes straight from the original demand equation
+        inverse_demand = solve_for_price(demand.equation.equation)
 
-        # Solve for price
-        eq_price = sp.solve(eq, p)[0]
+        # Solve demand - supply = 0 for price, from the tabulated formula when there is one
+        eq_price = closed_form_price(demand.function_type, supply.function_type, demand_expr, supply_expr)
+        if eq_price is None:
+            price_solutions = _solve_equilibrium_system(
+                demand.function_type, supply.function_type, demand_expr - supply_expr
+            )
+            if not price_solutions:
+                return None
+            eq_price = _select_price(price_solutions)
 
         # Substitute back to get quantity
         eq_quantity = demand_expr.subs(p, eq_price)
 
         # Simplify expressions
-        eq_price = sp.simplify(eq_price)
-        eq_quantity = sp.simplify(eq_quantity)
+        eq_price = targeted_simplify(eq_price, demand.function_type, supply.function_type)
+        eq_quantity = targeted_simplify(eq_quantity, demand.function_type, supply.function_type)
 
         return eq_price, eq_quantity, inverse_demand
 
@@ -1,8 +1,20 @@
 from __future__ import annotations
+import functools
 from typing import Dict, Optional
 import sympy as sp
-from ...core.market_base import MarketFunction
-from ...core.symbols import p, q
+from ...core.market_base import MarketFunction, solve_for_price
+from ...core.symbols import q
+from .solver import targeted_simplify
+from ._closed_forms import CS_FORMULAS, PS_FORMULAS, closed_form_surplus
+
+# Symbolic upper limit for integrals of inverse curves
+_UPPER = sp.Symbol("Q", positive=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _inverse_integral(inverse: sp.Expr) -> sp.Expr:
+    """Integrate an inverse curve over [0, Q] for symbolic Q, memoized per curve."""
+    return sp.integrate(inverse, (q, 0, _UPPER))
 
 
 def calculate_surpluses(
@@ -10,30 +22,39 @@ def calculate_surpluses(
     supply: MarketFunction,
     eq_price: sp.Expr,
     eq_quantity: sp.Expr,
+    inverse_demand: Optional[sp.Expr] = None,
 ) -> Dict[str, Optional[sp.Expr]]:
-    """Calculate consumer and producer surplus."""
+    """Calculate consumer and producer surplus.
+
+    Solved curve expressions are reused from the market functions; pass ``inverse_demand``
+    when it is already known to skip solving for it again.
+    """
     try:
-        # Get demand and supply expressions
-        demand_expr = sp.solve(demand.equation.equation, q)[0]  # q = a - bp
-        supply_expr = sp.solve(supply.equation.equation, q)[0]  # q = c + dp
-
-        # Get inverse functions
-        inverse_demand = sp.solve(sp.Eq(q, demand_expr), p)[0]  # p = (a-q)/b
-        inverse_supply = sp.solve(sp.Eq(q, supply_expr), p)[0]  # p = (q-c)/d
-
-        # Calculate consumer surplus
-        cs_integrand = inverse_demand - eq_price
-        cs = sp.integrate(cs_integrand, (q, 0, eq_quantity))
-        cs = sp.simplify(cs)
-
-        # Calculate producer surplus
-        ps_integrand = eq_price - inverse_supply
-        ps = sp.integrate(ps_integrand, (q, 0, eq_quantity))
-        ps = sp.simplify(ps)
-
-        # Calculate total surplus
-        total = cs + ps
-        total = sp.simplify(total)
+        types = demand.function_type, supply.function_type
+
+        # Get demand and supply expressions (cached on the market functions)
+        demand_expr = demand.get_quantity_expr()  # q = a - bp
+        supply_expr = supply.get_quantity_expr()  # q = c + dp
+
+        # Use tabulated closed forms for known curve families
+        cs = closed_form_surplus(CS_FORMULAS, demand.function_type, demand_expr, eq_price, eq_quantity)
+        ps = closed_form_surplus(PS_FORMULAS, supply.function_type, supply_expr, eq_price, eq_quantity)
+
+        # Calculate consumer surplus: area under inverse demand over [0, q_eq] minus expenditure
+        if cs is None:
+            if inverse_demand is None:
+                inverse_demand = solve_for_price(demand.equation.equation)  # p = (a-q)/b
+            cs = _inverse_integral(inverse_demand).subs(_UPPER, eq_quantity) - eq_price * eq_quantity
+        cs = targeted_simplify(cs, *types)
+
+        # Calculate producer surplus: revenue minus area under inverse supply over [0, q_eq]
+        if ps is None:
+            inverse_supply = solve_for_price(supply.equation.equation)  # p = (q-c)/d
+            ps = eq_price * eq_quantity - _inverse_integral(inverse_supply).subs(_UPPER, eq_quantity)
+        ps = targeted_simplify(ps, *types)
+
+        # Calculate total surplus; cs and ps are already simplified, so only combine denominators
+        total = sp.together(cs + ps)
 
         return {"Consumer_Surplus": cs, "Producer_Surplus": ps, "Total_Surplus": total}
 
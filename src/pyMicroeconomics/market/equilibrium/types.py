@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TypedDict, Optional, Union
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, TypedDict, Union
 import sympy as sp
 from ...core.equation_types import TypedEquation
 
@@ -18,3 +18,10 @@ class EquilibriumResult(TypedDict):
     Inverse_Demand_Function: Union[sp.Eq, sp.Rel]  # Updated type
     Demand_Type: str
     Supply_Type: str
+
+
+class CompiledEquilibrium(NamedTuple):
+    """Lambdified equilibrium values sharing one parameter signature."""
+
+    symbols: Tuple[sp.Symbol, ...]
+    functions: Dict[str, Callable[..., Any]]
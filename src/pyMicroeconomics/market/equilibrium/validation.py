@@ -5,6 +5,16 @@ from ...core.market_base import MarketFunction
 from ...core.symbols import p, q
 
 
+def _numeric_value(expr: sp.Expr) -> Optional[float]:
+    """Convert an expression with no free symbols to float, or return None if it is symbolic."""
+    if expr.free_symbols:
+        return None
+    try:
+        return float(expr)
+    except TypeError:
+        return None
+
+
 def validate_market_functions(demand: MarketFunction, supply: MarketFunction) -> Tuple[bool, Optional[str]]:
     """Validate market functions for economic consistency."""
     try:
@@ -12,6 +22,14 @@ def validate_market_functions(demand: MarketFunction, supply: MarketFunction) ->
         demand_slope = demand.get_slope()
         supply_slope = supply.get_slope()
 
+        # Constant numeric slopes can be checked without the assumptions system
+        demand_value = _numeric_value(demand_slope)
+        supply_value = _numeric_value(supply_slope)
+        if demand_value is not None and supply_value is not None:
+            if demand_value <= 0 and supply_value >= 0:
+                return True, None
+            return False, "Invalid slopes for supply and demand curves"
+
         # Create a positive test point
         test_p = sp.Symbol("test_p", positive=True)
 
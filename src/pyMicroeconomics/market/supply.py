@@ -1,29 +1,78 @@
 from __future__ import annotations
+import math
+import numpy as np
 import sympy as sp
-from ..core.market_base import MarketFunction
+from typing import Dict, Optional
+from ..core.market_base import MarketFunction, ParameterDict, ParameterValue, register_fast_eval
 from ..core.equation_types import TypedEquation
 from ..core.symbols import p, q, c, d
 
+# Symbolic supply equations, built once and shared by every factory call
+_EQUATION_TEMPLATES: Dict[str, sp.Eq] = {
+    "linear_supply": sp.Eq(q, c + d * p),
+    "power_supply": sp.Eq(q, c * p**d),
+    "exponential_supply": sp.Eq(q, sp.exp(c * p + d)),
+    "quadratic_supply": sp.Eq(q, c + d * p**2),
+}
 
-def linear_supply() -> MarketFunction:
+
+def _supply(name: str, c_param: Optional[ParameterValue], d_param: Optional[ParameterValue]) -> MarketFunction:
+    """Build a supply function from its template, storing any given parameter values."""
+    params: ParameterDict = {sym: val for sym, val in ((c, c_param), (d, d_param)) if val is not None}
+    return MarketFunction(TypedEquation.get(_EQUATION_TEMPLATES[name], name), name, params)
+
+
+def linear_supply(c_param: Optional[ParameterValue] = None, d_param: Optional[ParameterValue] = None) -> MarketFunction:
     """Create linear supply curve equation: q = c + d*p"""
-    eq = TypedEquation(sp.Eq(q, c + d * p), "linear_supply")
-    return MarketFunction(eq, "linear_supply")
+    return _supply("linear_supply", c_param, d_param)
 
 
-def power_supply() -> MarketFunction:
+def power_supply(c_param: Optional[ParameterValue] = None, d_param: Optional[ParameterValue] = None) -> MarketFunction:
     """Create power supply curve equation: q = c*p^d"""
-    eq = TypedEquation(sp.Eq(q, c * p**d), "power_supply")
-    return MarketFunction(eq, "power_supply")
+    return _supply("power_supply", c_param, d_param)
 
 
-def exponential_supply() -> MarketFunction:
+def exponential_supply(
+    c_param: Optional[ParameterValue] = None, d_param: Optional[ParameterValue] = None
+) -> MarketFunction:
     """Create exponential supply curve equation: q = exp(c*p + d)"""
-    eq = TypedEquation(sp.Eq(q, sp.exp(c * p + d)), "exponential_supply")
-    return MarketFunction(eq, "exponential_supply")
+    return _supply("exponential_supply", c_param, d_param)
 
 
-def quadratic_supply() -> MarketFunction:
+def quadratic_supply(
+    c_param: Optional[ParameterValue] = None, d_param: Optional[ParameterValue] = None
+) -> MarketFunction:
     """Create quadratic supply curve equation: q = c + d*p^2"""
-    eq = TypedEquation(sp.Eq(q, c + d * p**2), "quadratic_supply")
-    return MarketFunction(eq, "quadratic_supply")
+    return _supply("quadratic_supply", c_param, d_param)
+
+
+# Plain-Python evaluators for the built-in curves, bypassing SymPy on the scalar and array paths
+register_fast_eval(
+    "linear_supply",
+    _EQUATION_TEMPLATES["linear_supply"],
+    (c, d),
+    lambda price, c_val, d_val: c_val + d_val * price,
+    lambda price, c_val, d_val: d_val,
+)
+register_fast_eval(
+    "power_supply",
+    _EQUATION_TEMPLATES["power_supply"],
+    (c, d),
+    lambda price, c_val, d_val: c_val * price**d_val,
+    lambda price, c_val, d_val: c_val * d_val * price ** (d_val - 1),
+)
+register_fast_eval(
+    "exponential_supply",
+    _EQUATION_TEMPLATES["exponential_supply"],
+    (c, d),
+    lambda price, c_val, d_val: math.exp(c_val * price + d_val),
+    lambda price, c_val, d_val: c_val * math.exp(c_val * price + d_val),
+    lambda price, c_val, d_val: np.exp(c_val * price + d_val),
+)
+register_fast_eval(
+    "quadratic_supply",
+    _EQUATION_TEMPLATES["quadratic_supply"],
+    (c, d),
+    lambda price, c_val, d_val: c_val + d_val * price**2,
+    lambda price, c_val, d_val: 2 * d_val * price,
+)
@@ -5,6 +5,8 @@ Module for optimizing economic parameters to maximize total surplus in market eq
 import sympy as sp
 import numpy as np
 import scipy.optimize as opt
+from ..core.equation_types import substitute_values
+from ..core.market_base import quantity_slope, solve_for_quantity
 from ..core.symbols import p, q
 
 
@@ -26,6 +28,12 @@ def optimize_parameters(equilibrium_results):
     supply_eq = equilibrium_results["Supply Equation"]
     params = list((demand_eq.free_symbols | supply_eq.free_symbols) - {p, q})
 
+    # Solve for q and differentiate once, symbolically; each evaluation only substitutes numbers
+    demand_sym = getattr(demand_eq, "equation", demand_eq)
+    supply_sym = getattr(supply_eq, "equation", supply_eq)
+    demand_q_sym, demand_slope_sym = solve_for_quantity(demand_sym), quantity_slope(demand_sym)
+    supply_q_sym, supply_slope_sym = solve_for_quantity(supply_sym), quantity_slope(supply_sym)
+
     def evaluate_surplus(param_values):
         param_dict = dict(zip(params, param_values))
         demand_eq_num = demand_eq.subs(param_dict)
@@ -44,14 +52,14 @@ def optimize_parameters(equilibrium_results):
                 return float("inf")
 
             # Get demand and supply functions
-            demand_q = sp.solve(demand_eq_num, q)[0]
-            supply_q = sp.solve(supply_eq_num, q)[0]
+            demand_q = substitute_values(demand_q_sym, param_dict)
+            supply_q = substitute_values(supply_q_sym, param_dict)
 
             # Test if demand slope is negative and supply slope is positive
             # at equilibrium point
             try:
-                demand_slope = float(sp.N(sp.diff(demand_q, p).subs(p, p_eq)))
-                supply_slope = float(sp.N(sp.diff(supply_q, p).subs(p, p_eq)))
+                demand_slope = float(sp.N(substitute_values(demand_slope_sym, {**param_dict, p: p_eq})))
+                supply_slope = float(sp.N(substitute_values(supply_slope_sym, {**param_dict, p: p_eq})))
                 if demand_slope >= 0 or supply_slope <= 0:
                     return float("inf")
             except (ValueError, TypeError):
@@ -1,12 +1,68 @@
 """Module for displaying market equilibrium results in HTML format."""
 
+import html
 from typing import Optional, Dict, Union
+import numpy as np
 import sympy as sp
-from IPython.display import display, HTML, Math
-from ..core.equation_types import TypedEquation
+from IPython.display import display, HTML
+from ..core.equation_types import TypedEquation, substitute_values
+from ..market.equilibrium.compiled import compile_equilibrium, real_values
 from ..market.equilibrium.types import EquilibriumResult
 
 
+NUMERIC_EXCEPTIONS = (TypeError, ValueError, ZeroDivisionError, OverflowError, NameError)
+
+
+def _numeric_values(
+    equilibrium_results: EquilibriumResult,
+    expressions: Dict[str, sp.Expr],
+    parameter_subs: Dict[sp.Symbol, Union[float, int]],
+) -> Dict[str, float]:
+    """Evaluate expressions with the result's compiled functions, falling back to ``sp.N`` per key.
+
+    Keys whose expression cannot be evaluated to a real number are left out.
+    """
+    compiled = compile_equilibrium(equilibrium_results)
+    # Symbols without a value give NaN, so only the keys that depend on them fall back
+    args = [parameter_subs.get(symbol, np.nan) for symbol in compiled.symbols]
+    numeric = {}
+    for key, expr in expressions.items():
+        value: Optional[float] = np.nan
+        if key in compiled.functions:
+            try:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    value = float(real_values(compiled.functions[key](*args)))
+            except NUMERIC_EXCEPTIONS:
+                pass
+        if not np.isfinite(value):
+            value = _numeric_value(expr, parameter_subs)
+        if value is not None:
+            numeric[key] = value
+    return numeric
+
+
+def _numeric_value(expr: sp.Expr, parameter_subs: Dict[sp.Symbol, Union[float, int]]) -> Optional[float]:
+    """Evaluate one expression with ``sp.N``; None if it doesn't give a real number."""
+    try:
+        return float(sp.N(substitute_values(expr, parameter_subs)))
+    except NUMERIC_EXCEPTIONS:
+        return None
+
+
+def _table_row(label: str, content: str) -> str:
+    """HTML for one labelled row of the results table."""
+    return f"""
+                <tr style="border-bottom: 1px solid #ddd;">
+                    <td style="padding: 12px; text-align: right; width: 40%; font-weight: bold; color: #444;">
+                        {label}:
+                    </td>
+                    <td style="padding: 12px; text-align: left;">
+                        {content}
+                    </td>
+                </tr>
+                """
+
+
 def display_equilibrium(
     equilibrium_results: Optional[EquilibriumResult],
     parameter_subs: Optional[Dict[sp.Symbol, Union[float, int]]] = None,
@@ -38,20 +94,24 @@ def display_equilibrium(
 
     formatted_results: Dict[str, str] = {}
 
+    # Evaluate all numeric values with the compiled equilibrium functions
+    numeric_values: Dict[str, float] = {}
+    if parameter_subs:
+        expressions = {
+            key: value
+            for key, value in equilibrium_results.items()
+            if isinstance(value, sp.Expr) and key != "Inverse_Demand_Function"
+        }
+        numeric_values = _numeric_values(equilibrium_results, expressions, parameter_subs)
+
     for key, value in equilibrium_results.items():
         # Handle symbolic expressions
         if isinstance(value, sp.Expr):
             if key == "Inverse_Demand_Function":
                 # Add the "p = " prefix for inverse demand function
                 formatted_results[key] = f"p = {sp.latex(value)}"
-            elif parameter_subs:
-                try:
-                    # Try numerical substitution
-                    numeric_value = sp.N(value.subs(parameter_subs))
-                    formatted_results[key] = f"{numeric_value:.2f}"
-                except:
-                    # If substitution fails, show symbolic form
-                    formatted_results[key] = sp.latex(value)
+            elif key in numeric_values:
+                formatted_results[key] = f"{numeric_values[key]:.2f}"
             else:
                 # Show symbolic form
                 formatted_results[key] = sp.latex(value)
@@ -61,7 +121,7 @@ def display_equilibrium(
             if parameter_subs:
                 try:
                     # Try numerical substitution in equation
-                    subbed_eq = value.equation.subs(parameter_subs)
+                    subbed_eq = substitute_values(value.equation, parameter_subs)
                     formatted_results[key] = sp.latex(subbed_eq)
                 except:
                     # If substitution fails, show symbolic form
@@ -74,17 +134,6 @@ def display_equilibrium(
         else:
             formatted_results[key] = str(value)
 
-    # Display header
-    display(
-        HTML(
-            """
-        <div style="margin: 20px;">
-            <h3 style="text-align: center; margin-bottom: 15px;">Market Equilibrium Results</h3>
-            <table style="border-collapse: collapse; width: 100%; margin: auto;">
-        """
-        )
-    )
-
     # Define display order
     display_order = [
         "Equilibrium_Price",
@@ -97,59 +146,30 @@ def display_equilibrium(
         "Inverse_Demand_Function",
     ]
 
-    # Display each row
+    # Build the whole table as one HTML payload; MathJax typesets the $$...$$ cells
+    rows = []
     for key in display_order:
         if key in formatted_results:
             value = formatted_results[key]
-            display_label = key_labels.get(key, key)
 
             # Skip None values
             if value == "None":
                 continue
 
-            # Display row start
-            display(
-                HTML(
-                    f"""
-                <tr style="border-bottom: 1px solid #ddd;">
-                    <td style="padding: 12px; text-align: right; width: 40%; font-weight: bold; color: #444;">
-                        {display_label}:
-                    </td>
-                    <td style="padding: 12px; text-align: left;">
-                """
-                )
-            )
-
-            # Display the math content
-            display(Math(value))
-
-            # Display row end
-            display(HTML("</td></tr>"))
+            rows.append(_table_row(key_labels.get(key, key), f"$$ {html.escape(value, quote=False)} $$"))
 
     # Add function types at the bottom
     for key in ["Demand_Type", "Supply_Type"]:
         if key in formatted_results:
-            display_label = key_labels.get(key, key)
-            value = formatted_results[key]
-            display(
-                HTML(
-                    f"""
-                <tr style="border-bottom: 1px solid #ddd;">
-                    <td style="padding: 12px; text-align: right; width: 40%; font-weight: bold; color: #444;">
-                        {display_label}:
-                    </td>
-                    <td style="padding: 12px; text-align: left;">
-                        {value}
-                    </td>
-                </tr>
-                """
-                )
-            )
+            rows.append(_table_row(key_labels.get(key, key), formatted_results[key]))
 
-    # Close table
     display(
         HTML(
-            """
+            f"""
+        <div style="margin: 20px;">
+            <h3 style="text-align: center; margin-bottom: 15px;">Market Equilibrium Results</h3>
+            <table style="border-collapse: collapse; width: 100%; margin: auto;">
+                {"".join(rows)}
             </table>
         </div>
         """
@@ -1,44 +1,224 @@
 """Module for creating interactive market equilibrium plots with adjustable parameters."""
 
-from typing import Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
 import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import gridspec
+from matplotlib.patches import Polygon
 from ipywidgets import widgets, Layout
 from IPython.display import display, HTML
+from ..core.market_base import array_quantity_function, solve_for_price, solve_for_quantity
 from ..core.symbols import p, q
-from ..market.equilibrium.types import EquilibriumResult
+from ..market.equilibrium.compiled import VALUE_KEYS, compile_equilibrium, real_values
+from ..market.equilibrium.types import CompiledEquilibrium, EquilibriumResult
 
+try:
+    import numba
+except ImportError:  # Optional dependency
+    numba = None
 
-def plot_equilibrium(equilibrium_results: Optional[EquilibriumResult]) -> None:
+try:
+    import numexpr
+except ImportError:  # Optional dependency
+    numexpr = None
+
+try:
+    import symengine
+except ImportError:  # Optional dependency
+    symengine = None
+
+NUMEXPR_ERRORS = (TypeError, ValueError, KeyError, NotImplementedError)
+SYMENGINE_ERRORS = (RuntimeError, TypeError, ValueError, NotImplementedError)
+
+# Slider changes closer together than this are rendered once, with the latest values
+DEBOUNCE_SECONDS = 0.05
+
+# Below this many samples, thread hand-off costs more than evaluating the curves one after the other
+PARALLEL_MIN_POINTS = 50_000
+
+
+class _PlotData(NamedTuple):
+    """Numeric values needed to draw one parameter configuration."""
+
+    eq_price: float
+    eq_quantity: float
+    p_values: np.ndarray
+    q_demand: np.ndarray
+    q_supply: np.ndarray
+    q_cs: np.ndarray
+    p_demand: np.ndarray
+    p_supply: np.ndarray
+    cs: float
+    ps: float
+    total: float
+
+
+@functools.lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    """Shared worker pool for evaluating curves concurrently, created on first use."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pyMicroeconomics-plot")
+
+
+def _evaluate_quietly(func: Callable[..., np.ndarray], *args) -> np.ndarray:
+    """Evaluate a curve with floating-point warnings silenced (error state is per thread)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return func(*args)
+
+
+def _surplus_vertices(vertices: np.ndarray, q_cs: np.ndarray, p_curve: np.ndarray, eq_price: float) -> np.ndarray:
+    """Write the outline of a surplus region into a preallocated (n + 2, 2) buffer and return the used part.
+
+    The outline follows the inverse curve over ``q_cs`` and closes along the equilibrium price.
+    """
+    n = q_cs.size
+    if n == 0:
+        return vertices[:0]
+    vertices[:n, 0] = q_cs
+    vertices[:n, 1] = p_curve
+    vertices[n] = q_cs[-1], eq_price
+    vertices[n + 1] = q_cs[0], eq_price
+    return vertices[: n + 2]
+
+
+def _with_fallback(fast: Callable[..., np.ndarray], slow: Callable[..., np.ndarray], errors) -> Callable:
+    """Call ``fast``, switching to ``slow`` for good once ``fast`` raises one of ``errors``."""
+    compiled = [fast]
+
+    def call(*values):
+        try:
+            return compiled[0](*values)
+        except errors:
+            compiled[0] = slow
+            return slow(*values)
+
+    return call
+
+
+def _symengine_function(args: Sequence[sp.Symbol], expr: sp.Expr) -> Callable[..., np.ndarray]:
+    """Compile an expression to native code with SymEngine's LLVM backend, called like a lambdified function."""
+    callback = symengine.Lambdify(list(args), expr, backend="llvm", cse=True)
+
+    def call(*values):
+        return callback(np.stack(np.broadcast_arrays(*values), axis=-1))
+
+    return call
+
+
+def _compile_array_function(args: Sequence[sp.Symbol], expr: sp.Expr) -> Callable[..., np.ndarray]:
+    """Lambdify an expression for array evaluation using the fastest available backend.
+
+    Uses Numba when installed, otherwise SymEngine's LLVM backend, otherwise numexpr. Expressions they
+    can't handle fall back to NumPy (with SciPy special functions when available).
+    """
+    func = sp.lambdify(args, expr, cse=True)
+    if numba is not None:
+        return _with_fallback(numba.njit(func), func, numba.core.errors.NumbaError)
+    if symengine is not None:
+        try:
+            return _with_fallback(_symengine_function(args, expr), func, SYMENGINE_ERRORS)
+        except SYMENGINE_ERRORS:  # Unsupported function, or SymEngine built without LLVM
+            pass
+    if numexpr is not None:
+        try:
+            return _with_fallback(sp.lambdify(args, expr, "numexpr"), func, NUMEXPR_ERRORS)
+        except TypeError:  # Contains functions numexpr doesn't support
+            pass
+    return func
+
+
+def _quantity_function(
+    function_type: str, equation: sp.Eq, syms: Tuple[sp.Symbol, ...]
+) -> Callable[..., np.ndarray]:
+    """Quantity curve taking (prices, *syms values), preferring the hand-written kernel for built-in curves."""
+    registered = array_quantity_function(function_type, equation)
+    if registered is None or not set(registered[0]) <= set(syms):
+        return _compile_array_function((p, *syms), solve_for_quantity(equation))
+    params, kernel = registered
+    # Map the plot's argument order onto the kernel's once, when the closure is built
+    positions = tuple(syms.index(symbol) for symbol in params)
+    return lambda prices, *values: kernel(prices, *(values[i] for i in positions))
+
+
+def _equilibrium_function(compiled: CompiledEquilibrium, syms: Tuple[sp.Symbol, ...]) -> Callable[..., np.ndarray]:
+    """Price, quantity and surpluses taking (*syms values), from an equilibrium's compiled functions.
+
+    Values that were not compiled (missing or non-finite surpluses) evaluate to NaN.
+    """
+    # Map the plot's argument order onto the compiled functions' once, when the closure is built
+    positions = tuple(syms.index(symbol) for symbol in compiled.symbols)
+    functions = [compiled.functions.get(key) for key in VALUE_KEYS]
+
+    def evaluate(*values):
+        args = [values[i] for i in positions]
+        return real_values([np.nan if func is None else func(*args) for func in functions])
+
+    return evaluate
+
+
+class _PlotFunctions(NamedTuple):
+    """Compiled curve functions for one pair of market equations; parameters are passed in ``symbols`` order."""
+
+    symbols: Tuple[sp.Symbol, ...]
+    demand_quantity: Callable[..., np.ndarray]
+    supply_quantity: Callable[..., np.ndarray]
+    inverse_demand: Callable[..., np.ndarray]
+    inverse_supply: Callable[..., np.ndarray]
+
+
+@functools.lru_cache(maxsize=64)
+def _plot_functions(
+    demand_eq: sp.Eq,
+    supply_eq: sp.Eq,
+    demand_type: str,
+    supply_type: str,
+    inverse_demand: sp.Expr,
+) -> _PlotFunctions:
+    """Solve and compile the curves a plot needs, memoized so re-plotting the same result is instant."""
+    syms = tuple(sorted((demand_eq.free_symbols | supply_eq.free_symbols) - {p, q}, key=str))
+    return _PlotFunctions(
+        syms,
+        _quantity_function(demand_type, demand_eq, syms),
+        _quantity_function(supply_type, supply_eq, syms),
+        _compile_array_function((q, *syms), inverse_demand),
+        _compile_array_function((q, *syms), solve_for_price(supply_eq)),
+    )
+
+
+def plot_equilibrium(equilibrium_results: Optional[EquilibriumResult], num_points: int = 200) -> None:
     if equilibrium_results is None:
         print("Please provide valid equilibrium results.")
         return
 
     # Import the actual symbol objects being used in the equations
-    from ..core.symbols import a, b, c, d, p, q
+    from ..core.symbols import a, b, c, d
 
     # Get equations and equilibrium values
     demand_eq = equilibrium_results["Demand_Equation"]
     supply_eq = equilibrium_results["Supply_Equation"]
-    eq_price = equilibrium_results["Equilibrium_Price"]
-    eq_quantity = equilibrium_results["Equilibrium_Quantity"]
     inverse_demand = equilibrium_results["Inverse_Demand_Function"]
 
-    # Get inverse supply function
-    supply_expr = sp.solve(supply_eq.equation, q)[0]
-    inverse_supply = sp.solve(sp.Eq(q, supply_expr), p)[0]
+    # Compiled numeric functions; parameters are passed as trailing arguments
+    functions = _plot_functions(
+        demand_eq.equation,
+        supply_eq.equation,
+        equilibrium_results["Demand_Type"],
+        equilibrium_results["Supply_Type"],
+        inverse_demand,
+    )
+    syms = functions.symbols
+    # Price, quantity and surpluses come from the same compiled functions as market_equilibrium_batch
+    equilibrium = _equilibrium_function(compile_equilibrium(equilibrium_results), syms)
 
     # Define default parameters using the imported symbols
     default_params = {a: 10.0, b: 2.0, c: 0.0, d: 3.0}
 
-    # Get all symbolic parameters
-    all_symbols = (demand_eq.free_symbols | supply_eq.free_symbols) - {p, q}
-
     # Create parameter sliders
     param_inputs = {}
-    for symbol in sorted(all_symbols, key=str):
+    for symbol in syms:
         default_value = default_params[symbol]
         if str(symbol) == "c":  # Special case for c to allow negative values
             param_inputs[str(symbol)] = widgets.FloatSlider(
@@ -65,110 +245,124 @@ def plot_equilibrium(equilibrium_results: Optional[EquilibriumResult]) -> None:
                 style={"description_width": "initial"},
             )
 
-    # Create symbol mapping
-    symbol_map = {"a": a, "b": b, "c": c, "d": d}
+    # Sample positions on [0, 1], scaled to each configuration's price and quantity range.
+    # Drawing arrays are float32: matplotlib renders at that precision anyway.
+    unit_grid = np.linspace(0.0, 1.0, num_points, dtype=np.float32)
+
+    @functools.lru_cache(maxsize=128)
+    def _compute(vals: Tuple[float, ...]) -> _PlotData:
+        """Numeric curves, equilibrium and surpluses for one set of (rounded) parameter values."""
+        # Evaluate equilibrium values and surpluses; NumPy scalars give NaN/inf rather than raising
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = equilibrium(*map(np.float64, vals))
+        eq_price_val, eq_quantity_val, cs, ps, total = map(float, values)
+        if not np.isfinite([eq_price_val, eq_quantity_val]).all():
+            raise ValueError("No real equilibrium for these parameter values")
+
+        # One block holds the price range and both quantity curves; rows are filled in place
+        curves = np.empty((3, unit_grid.size), dtype=np.float32)
+        p_values, q_demand, q_supply = curves
+        np.multiply(unit_grid, eq_price_val * 2, out=p_values)
+        q_values = unit_grid * (eq_quantity_val * 2)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Calculate curves; negative quantities are not drawn
+            if unit_grid.size >= PARALLEL_MIN_POINTS:
+                # The curves are independent and NumPy releases the GIL, so evaluate demand on a worker
+                demand_future = _executor().submit(_evaluate_quietly, functions.demand_quantity, p_values, *vals)
+                q_supply[:] = functions.supply_quantity(p_values, *vals)
+                q_demand[:] = demand_future.result()
+            else:
+                q_demand[:] = functions.demand_quantity(p_values, *vals)
+                q_supply[:] = functions.supply_quantity(p_values, *vals)
+            quantities = curves[1:]
+            quantities[quantities < 0] = np.nan
+
+            # Inverse curves over the surplus region; the grid is sorted, so this is a view up to the cutoff
+            q_cs = q_values[: np.searchsorted(q_values, eq_quantity_val, side="right")]
+            inverse = np.empty((2, q_cs.size), dtype=np.float32)
+            p_demand, p_supply = inverse
+            p_demand[:] = functions.inverse_demand(q_cs, *vals)
+            p_supply[:] = functions.inverse_supply(q_cs, *vals)
+
+        return _PlotData(
+            eq_price_val, eq_quantity_val, p_values, q_demand, q_supply, q_cs, p_demand, p_supply, cs, ps, total
+        )
+
+    # Build the figure once; each update only changes artist data
+    with plt.ioff():
+        fig = plt.figure(figsize=(15, 6))
+    # Drop it from pyplot's registry so repeated calls don't accumulate open figures; display(fig) still works
+    plt.close(fig)
+    gs = gridspec.GridSpec(1, 2, width_ratios=[2, 1], figure=fig)
+
+    # Main plot
+    ax1 = fig.add_subplot(gs[0])
+    (demand_line,) = ax1.plot([], [], label="Demand", color="blue")
+    (supply_line,) = ax1.plot([], [], label="Supply", color="orange")
+    # Consumer Surplus - Area above equilibrium price and below demand curve
+    cs_patch = ax1.add_patch(Polygon(np.empty((0, 2)), alpha=0.3, color="blue", label="Consumer Surplus"))
+    # Producer Surplus - Area below equilibrium price and above supply curve
+    ps_patch = ax1.add_patch(Polygon(np.empty((0, 2)), alpha=0.3, color="orange", label="Producer Surplus"))
+    # Reused outline buffers; set_xy copies, so one buffer per patch is enough
+    cs_vertices = np.empty((num_points + 2, 2), dtype=np.float32)
+    ps_vertices = np.empty_like(cs_vertices)
+    (eq_point,) = ax1.plot([], [], "ro", label="Equilibrium")
+
+    # Plot formatting
+    ax1.legend()
+    ax1.set_xlabel("Quantity")
+    ax1.set_ylabel("Price")
+    ax1.set_title("Market Equilibrium")
+    ax1.grid(True)
+
+    # Info panel
+    ax2 = fig.add_subplot(gs[1])
+    ax2.axis("off")
+    results_artist = ax2.text(
+        0.1,
+        0.9,
+        "",
+        transform=ax2.transAxes,
+        verticalalignment="top",
+        fontfamily="monospace",
+        bbox=dict(boxstyle="round", facecolor="white", alpha=0.8, edgecolor="gray"),
+    )
+    fig.tight_layout()
 
     def update(**kwargs):
         """Update plot with new parameter values."""
         try:
-            # Convert string keys to actual symbols
-            params = {symbol_map[k]: v for k, v in kwargs.items()}
-
-            # Get expressions
-            demand_expr = sp.solve(demand_eq.equation, q)[0]
-            supply_expr = sp.solve(supply_eq.equation, q)[0]
-
-            # Substitute parameters into expressions
-            eq_price_num = eq_price.subs(params)
-            eq_quantity_num = eq_quantity.subs(params)
-
-            # Convert to float
-            eq_price_val = float(sp.N(eq_price_num))
-            eq_quantity_val = float(sp.N(eq_quantity_num))
-
-            # Substitute parameters into expressions and inverse functions
-            demand_expr_num = demand_expr.subs(params)
-            supply_expr_num = supply_expr.subs(params)
-            inverse_demand_num = inverse_demand.subs(params)
-            inverse_supply_num = inverse_supply.subs(params)
-
-            # Create lambda functions
-            demand_func = sp.lambdify(p, demand_expr_num)
-            supply_func = sp.lambdify(p, supply_expr_num)
-            inverse_demand_func = sp.lambdify(q, inverse_demand_num)
-            inverse_supply_func = sp.lambdify(q, inverse_supply_num)
-
-            # Create plot
-            plt.close("all")
-            fig = plt.figure(figsize=(15, 6))
-            gs = gridspec.GridSpec(1, 2, width_ratios=[2, 1])
-
-            # Main plot
-            ax1 = plt.subplot(gs[0])
-
-            # Create price and quantity ranges
-            p_values = np.linspace(0, eq_price_val * 2, 200)
-            q_values = np.linspace(0, eq_quantity_val * 2, 200)
-
-            # Calculate curves
-            q_demand = demand_func(p_values)
-            q_supply = supply_func(p_values)
-
-            # Plot the curves
-            ax1.plot(q_demand, p_values, label="Demand", color="blue")
-            ax1.plot(q_supply, p_values, label="Supply", color="orange")
-
-            # Consumer Surplus - Area above equilibrium price and below demand curve
-            q_cs = q_values[q_values <= eq_quantity_val]
-            p_demand = [float(sp.N(inverse_demand_num.subs(q, qi))) for qi in q_cs]
-
-            ax1.fill_between(
-                q_cs, [eq_price_val] * len(q_cs), p_demand, alpha=0.3, color="blue", label="Consumer Surplus"
-            )
-
-            # Producer Surplus - Area below equilibrium price and above supply curve
-            p_supply = [float(sp.N(inverse_supply_num.subs(q, qi))) for qi in q_cs]
+            # Revisited slider positions are served from the cache
+            data = _compute(tuple(round(kwargs[str(symbol)], 3) for symbol in syms))
+            eq_price_val, eq_quantity_val = data.eq_price, data.eq_quantity
 
-            ax1.fill_between(
-                q_cs, [eq_price_val] * len(q_cs), p_supply, alpha=0.3, color="orange", label="Producer Surplus"
-            )
+            # Update the curves and equilibrium point
+            demand_line.set_data(data.q_demand, data.p_values)
+            supply_line.set_data(data.q_supply, data.p_values)
+            eq_point.set_data([eq_quantity_val], [eq_price_val])
 
-            # Plot equilibrium point
-            ax1.plot([eq_quantity_val], [eq_price_val], "ro", label="Equilibrium")
+            # Reshape the surplus regions in place
+            cs_patch.set_xy(_surplus_vertices(cs_vertices, data.q_cs, data.p_demand, eq_price_val))
+            ps_patch.set_xy(_surplus_vertices(ps_vertices, data.q_cs, data.p_supply, eq_price_val))
 
-            # Plot formatting
-            ax1.legend()
-            ax1.set_xlabel("Quantity")
-            ax1.set_ylabel("Price")
-            ax1.set_title("Market Equilibrium")
-            ax1.grid(True)
+            ax1.relim()
+            ax1.autoscale_view()
             ax1.set_ylim(bottom=0)
             ax1.set_xlim(left=0)
 
-            # Info panel
-            ax2 = plt.subplot(gs[1])
-            ax2.axis("off")
-
-            # Calculate surpluses
-            try:
-                # Consumer Surplus
-                cs = np.trapezoid([p - eq_price_val for p in p_demand], q_cs)
-
-                # Producer Surplus
-                ps = np.trapezoid([eq_price_val - p for p in p_supply], q_cs)
-
-                total_surplus = cs + ps
+            # Surplus summary
+            if np.isfinite([data.cs, data.ps, data.total]).all():
                 surplus_text = (
-                    f"Consumer Surplus: {abs(cs):.2f}\n"
-                    f"Producer Surplus: {abs(ps):.2f}\n"
-                    f"Total Surplus: {total_surplus:.2f}"
+                    f"Consumer Surplus: {data.cs:.2f}\n"
+                    f"Producer Surplus: {data.ps:.2f}\n"
+                    f"Total Surplus: {data.total:.2f}"
                 )
-            except Exception as e:
-                print(f"Error calculating surplus: {str(e)}")
+            else:
                 surplus_text = "Surplus calculation error"
 
             # Results text
-            results_text = (
+            results_artist.set_text(
                 f"Equilibrium Values:\n"
                 f"─────────────────\n"
                 f"Price: {eq_price_val:.2f}\n"
@@ -182,18 +376,8 @@ def plot_equilibrium(equilibrium_results: Optional[EquilibriumResult]) -> None:
                 f"Supply: {equilibrium_results['Supply_Type']}"
             )
 
-            ax2.text(
-                0.1,
-                0.9,
-                results_text,
-                transform=ax2.transAxes,
-                verticalalignment="top",
-                fontfamily="monospace",
-                bbox=dict(boxstyle="round", facecolor="white", alpha=0.8, edgecolor="gray"),
-            )
-
-            plt.tight_layout()
-            plt.show()
+            fig.canvas.draw_idle()
+            display(fig)
 
         except Exception as e:
             print(f"Error in plotting: {str(e)}")
@@ -207,6 +391,37 @@ def plot_equilibrium(equilibrium_results: Optional[EquilibriumResult]) -> None:
         ]
     )
 
-    # Create interactive widget
-    out = widgets.interactive_output(update, param_inputs)
+    # Create interactive widget; one redraw per slider change, with intermediate draws and syncs held back
+    out = widgets.Output()
+
+    def render():
+        nonlocal pending_render, rendered_values
+        pending_render = None
+        values = {name: slider.value for name, slider in param_inputs.items()}
+        # Nothing to redraw if the sliders ended up where they were
+        if values == rendered_values:
+            return
+        rendered_values = values
+        with out, out.hold_trait_notifications(), plt.ioff():
+            out.clear_output(wait=True)
+            update(**values)
+
+    pending_render: Optional[asyncio.TimerHandle] = None
+    rendered_values: Optional[Dict[str, float]] = None
+
+    def schedule_render(change=None):
+        """Debounce slider changes on the running event loop (the kernel's), or render right away without one."""
+        nonlocal pending_render
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            render()
+            return
+        if pending_render is not None:
+            pending_render.cancel()
+        pending_render = loop.call_later(DEBOUNCE_SECONDS, render)
+
+    for slider in param_inputs.values():
+        slider.observe(schedule_render, "value")
+    render()
     display(widgets.VBox([widgets_box, out]))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import pytest
-import sympy as sp
-from pyMicroeconomics.core.equation_types import TypedEquation
-from pyMicroeconomics.core.symbols import p, q
+from sympy import Eq
+from pyMicroeconomics.core.equation_types import TypedEquation, substitute_values
+from pyMicroeconomics.core.symbols import p, q, a, b
 
 
 def test_typed_equation_creation():
-    eq = sp.Eq(q, 10 - 2 * p)
+    eq = Eq(q, 10 - 2 * p)
     typed_eq = TypedEquation(eq, "test_type")
 
     assert typed_eq.equation == eq
@@ -15,7 +15,7 @@ def test_typed_equation_creation():
 
 
 def test_typed_equation_substitution():
-    eq = sp.Eq(q, 10 - 2 * p)
+    eq = Eq(q, 10 - 2 * p)
     typed_eq = TypedEquation(eq, "test_type")
 
     # Test substitution
@@ -23,11 +23,44 @@ def test_typed_equation_substitution():
 
     assert isinstance(subbed_eq, TypedEquation)
     assert subbed_eq.function_type == "test_type"
-    assert subbed_eq.equation == sp.Eq(q, 6)
+    assert subbed_eq.equation == Eq(q, 6)
+
+
+def test_typed_equation_substitution_keeps_relation():
+    typed_eq = TypedEquation(Eq(q, a - b * p), "test_type")
+
+    # q is positive, so an evaluated Eq(q, -2*p) would collapse to False
+    subbed_eq = typed_eq.subs({a: 0, b: 2})
+    assert isinstance(subbed_eq.equation, Eq)
+    assert subbed_eq.equation.rhs == -2 * p
+
+    assert typed_eq.subs({q: 6, a: 10, b: 2}).equation == Eq(6, 10 - 2 * p)
+
+
+def test_typed_equation_get_interns():
+    eq = Eq(q, 10 - 2 * p)
+
+    shared = TypedEquation.get(eq, "test_type")
+    assert TypedEquation.get(Eq(q, 10 - 2 * p), "test_type") is shared
+    assert TypedEquation.get(eq, "other_type") is not shared
+    assert shared.equation == eq
+
+    with pytest.raises(AttributeError):
+        shared.equation = Eq(q, 5 - p)
+    assert TypedEquation.get(eq, "test_type").equation == eq
 
 
 def test_free_symbols():
-    eq = sp.Eq(q, 10 - 2 * p)
+    eq = Eq(q, 10 - 2 * p)
     typed_eq = TypedEquation(eq, "test_type")
 
     assert typed_eq.free_symbols == {p, q}
+    assert typed_eq.free_symbols is typed_eq.free_symbols
+
+
+def test_substitute_values_matches_subs():
+    expr = a - b * p**2
+
+    # Numeric values take the xreplace path, symbolic ones fall back to subs
+    assert substitute_values(expr, {a: 10, b: 0.5}) == expr.subs({a: 10, b: 0.5})
+    assert substitute_values(expr, {a: 2 * b}) == expr.subs({a: 2 * b})
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
-import sympy as sp
+from sympy import Eq, Float, diff, exp
 from typing import Dict, cast
-from pyMicroeconomics.core.market_base import MarketFunction, ParameterValue, ParameterDict
+from pyMicroeconomics.core.market_base import MarketFunction, ParameterValue, ParameterDict, solve_for_quantity
 from pyMicroeconomics.core.equation_types import TypedEquation
 from pyMicroeconomics.core.symbols import p, q, a, b
 
 
 def test_market_function_creation():
     """Test basic MarketFunction creation and validation."""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "test")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
     market_func = MarketFunction(eq, "test_type")
 
     assert market_func.function_type == "test_type"
@@ -19,7 +20,7 @@ def test_market_function_creation():
 
 def test_market_function_with_parameters():
     """Test MarketFunction with parameter values."""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "test")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
     params: ParameterDict = {a: cast(ParameterValue, 100), b: cast(ParameterValue, 2)}
     market_func = MarketFunction(eq, "test_type", params)
 
@@ -29,7 +30,7 @@ def test_market_function_with_parameters():
 
 def test_market_function_slope():
     """Test slope calculation."""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "test")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
     params: ParameterDict = {a: cast(ParameterValue, 100), b: cast(ParameterValue, 2)}
     market_func = MarketFunction(eq, "test_type", params)
 
@@ -37,16 +38,33 @@ def test_market_function_slope():
     assert slope == -2.0
 
 
+def test_market_function_slope_price_independent():
+    """Test that a quantity not depending on price has zero slope."""
+    eq = TypedEquation(Eq(q * p, a * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 10})
+
+    assert market_func.get_slope() == 0
+    assert market_func.get_slope(5.0) == 0.0
+    assert np.all(market_func.get_slope(np.array([1.0, 2.0])) == 0.0)
+
+
+def test_solve_for_quantity_explicit_and_implicit():
+    """Test that equations already solved for q are returned as-is and others are solved."""
+    explicit = Eq(q, a - b * p)
+    assert solve_for_quantity(explicit) is explicit.rhs
+    assert solve_for_quantity(Eq(p, a - b * q)) == (a - p) / b
+
+
 def test_invalid_equation():
     """Test validation of invalid equations."""
-    eq = TypedEquation(sp.Eq(a, b), "test")  # Missing p and q
+    eq = TypedEquation(Eq(a, b), "test")  # Missing p and q
     with pytest.raises(ValueError):
         MarketFunction(eq, "test_type")
 
 
 def test_market_function_parameter_update():
     """Test updating parameters after creation."""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "test")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
     initial_params: ParameterDict = {a: cast(ParameterValue, 100), b: cast(ParameterValue, 2)}
     market_func = MarketFunction(eq, "test_type", initial_params)
 
@@ -57,9 +75,116 @@ def test_market_function_parameter_update():
 
 def test_market_function_float_parameters():
     """Test MarketFunction with float parameters."""
-    eq = TypedEquation(sp.Eq(q, a - b * p), "test")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
     params: ParameterDict = {a: 100.0, b: 2.0}  # float is valid ParameterValue
     market_func = MarketFunction(eq, "test_type", params)
 
     quantity = market_func.evaluate(10.0)
     assert quantity == 80.0
+
+
+def test_market_function_caches_solved_expression():
+    """Test that the solved quantity expression is reused across calls."""
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100, b: 2})
+
+    market_func.evaluate(10.0)
+    solved = market_func._q_expr
+    market_func.get_slope(10.0)
+    market_func.evaluate(20.0)
+
+    assert market_func._q_expr is solved
+    assert market_func._dq_dp == -b
+
+
+def test_market_function_missing_parameters():
+    """Test that evaluating without all parameter values raises ValueError."""
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100})
+
+    with pytest.raises(ValueError, match="Missing parameter values"):
+        market_func.evaluate(10.0)
+
+
+def test_market_function_evaluate_array():
+    """Test vectorized evaluation over an array of prices."""
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100, b: 2})
+
+    quantities = market_func.evaluate_array(np.array([0.0, 10.0, 60.0]))
+    assert quantities[:2].tolist() == [100.0, 80.0]
+    assert np.isnan(quantities[2])  # Negative quantity
+
+    with pytest.raises(ValueError, match="Price cannot be negative"):
+        market_func.evaluate_array(np.array([-1.0, 1.0]))
+    with pytest.raises(ValueError, match="Price cannot be negative"):
+        market_func.evaluate_array(np.array([np.nan, -5.0]))
+
+    assert market_func.evaluate_array(np.array([])).shape == (0,)
+
+
+def test_market_function_jitted_evaluate():
+    """Test Numba-compiled evaluation matches the standard path."""
+    pytest.importorskip("numba")
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100, b: 2})
+
+    assert market_func.jitted_evaluate(10.0) == pytest.approx(market_func.evaluate(10.0))
+    assert market_func.jit() is market_func.jit()
+    with pytest.raises(ValueError, match="Quantity cannot be negative"):
+        market_func.jitted_evaluate(60.0)
+
+
+def test_market_function_compiled_shared_across_instances():
+    """Test that market functions with the same equation reuse one lambdified function."""
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    first = MarketFunction(eq, "test_type", {a: 100, b: 2})
+    second = MarketFunction(eq, "test_type", {a: 50, b: 1})
+
+    assert first._compiled("quantity") is second._compiled("quantity")
+    assert second.evaluate(10.0) == pytest.approx(40.0)
+
+
+def test_market_function_compound_curve():
+    """Test evaluation of a curve with repeated subexpressions matches SymPy."""
+    rhs = a * exp(-b * p) / (1 + exp(-b * p))
+    market_func = MarketFunction(TypedEquation(Eq(q, rhs), "test"), "test_type", {a: 100, b: 2})
+    values = {p: 1.5, a: 100, b: 2}
+
+    assert market_func.evaluate(1.5) == pytest.approx(float(rhs.subs(values)))
+    assert market_func.get_slope(1.5) == pytest.approx(float(diff(rhs, p).subs(values)))
+
+
+def test_market_function_slope_array():
+    """Test slope evaluation over an array of prices reuses the cached derivative."""
+    eq = TypedEquation(Eq(q, a - b * p**2), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100, b: 2})
+
+    slopes = market_func.get_slope(np.array([1.0, 2.0]))
+    assert slopes.tolist() == [-4.0, -8.0]
+    assert market_func.get_slope(1.0) == -4.0
+
+
+def test_market_function_symbolic_slope_memoized():
+    """Test the symbolic slope with parameters substituted is computed once per parameter set."""
+    eq = TypedEquation(Eq(q, a - b * p**2), "test")
+    first = MarketFunction(eq, "test_type", {a: 100, b: 2})
+    second = MarketFunction(eq, "test_type", {b: 2, a: 100})
+
+    assert first.get_slope() == -4 * p
+    assert first.get_slope() is second.get_slope()
+    assert MarketFunction(eq, "test_type", {a: 100.0, b: 2.0}).get_slope().has(Float)
+
+
+def test_market_function_substitute_params():
+    """Test substitute_params merges values without rewriting the equation."""
+    eq = TypedEquation(Eq(q, a - b * p), "test")
+    market_func = MarketFunction(eq, "test_type", {a: 100})
+    market_func.evaluate(10.0, {b: 2})
+
+    substituted = market_func.substitute_params({b: 3})
+    assert substituted.equation is eq
+    assert substituted.parameters == {a: 100, b: 3}
+    assert substituted._q_expr is market_func._q_expr
+    assert substituted.evaluate(10.0) == 70.0
+    assert market_func.parameters == {a: 100}
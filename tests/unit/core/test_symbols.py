@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+from pyMicroeconomics.core.symbols import p, q, a, b, c, d
+
+
+@pytest.mark.parametrize("symbol", [p, q, a, b, c, d])
+def test_symbols_are_positive_real(symbol):
+    """Solver and integration speed rely on these assumptions."""
+    assert symbol.is_real
+    assert symbol.is_positive
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sympy import diff
+from pyMicroeconomics.market.demand import linear_demand, power_demand, exponential_demand, quadratic_demand
+from pyMicroeconomics.market.supply import linear_supply, power_supply, exponential_supply, quadratic_supply
+from pyMicroeconomics.core.symbols import p, a, b, c, d
+
+DEMAND_PARAMS = {a: 3.0, b: 0.5}
+SUPPLY_PARAMS = {c: 1.5, d: 0.5}
+
+
+@pytest.mark.parametrize(
+    "factory, params",
+    [
+        *((factory, DEMAND_PARAMS) for factory in (linear_demand, power_demand, exponential_demand, quadratic_demand)),
+        *((factory, SUPPLY_PARAMS) for factory in (linear_supply, power_supply, exponential_supply, quadratic_supply)),
+    ],
+    ids=lambda value: getattr(value, "__name__", ""),
+)
+def test_curve_family_matches_sympy(factory, params):
+    """Test each curve family evaluates and differentiates like its SymPy equation."""
+    market_func = factory(*params.values())
+    rhs = market_func.equation.equation.rhs
+    prices = np.array([0.5, 1.0, 2.0])
+
+    expected = [float(rhs.subs({**params, p: price})) for price in prices]
+    assert market_func.evaluate(2.0) == pytest.approx(expected[2])
+    assert market_func.evaluate_array(prices) == pytest.approx(expected)
+    assert market_func.get_slope(2.0) == pytest.approx(float(diff(rhs, p).subs({**params, p: 2.0})))
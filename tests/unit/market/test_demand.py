@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-import sympy as sp
+from sympy import exp
 from pyMicroeconomics.market.demand import linear_demand, power_demand, exponential_demand, quadratic_demand
 from pyMicroeconomics.core.symbols import p, q
 
@@ -50,7 +50,7 @@ def test_exponential_demand():
 
     # Test evaluation
     quantity = demand.evaluate(10)
-    expected = sp.exp(-0.05 * 10 + 4.6)
+    expected = exp(-0.05 * 10 + 4.6)
     assert pytest.approx(quantity) == float(expected)
 
     # Test slope is negative
@@ -97,3 +97,17 @@ def test_demand_evaluation_errors():
     # Test evaluation with negative price
     with pytest.raises(ValueError, match="Price cannot be negative"):
         demand.evaluate(-10)
+
+    # Test evaluation that overflows a float
+    with pytest.raises(ValueError, match="Could not evaluate"):
+        exponential_demand(0.05, 1000).evaluate(10)
+
+
+@pytest.mark.demand
+def test_demand_solved_expression_shared_across_instances():
+    """Test that the solved q(p) is computed once per curve type."""
+    first = linear_demand(100, 2)
+    second = linear_demand(50, 1)
+
+    assert first.get_quantity_expr() is second.get_quantity_expr()
+    assert first.equation is second.equation
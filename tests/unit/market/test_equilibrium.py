@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import pytest
+from sympy import Float, Rational, exp, simplify
+from pyMicroeconomics.market.demand import exponential_demand, linear_demand, power_demand, quadratic_demand
+from pyMicroeconomics.market.supply import linear_supply, power_supply, quadratic_supply
+from pyMicroeconomics.market.equilibrium import compile_equilibrium, market_equilibrium, market_equilibrium_batch
+from pyMicroeconomics.market.equilibrium.validation import validate_market_functions
+from pyMicroeconomics.market.equilibrium.solver import _solve_equilibrium_system
+from pyMicroeconomics.market.equilibrium._closed_forms import CS_FORMULAS, closed_form_price, closed_form_surplus
+from pyMicroeconomics.core.symbols import a, b, c, d, p
+
+
+@pytest.mark.market
+def test_market_equilibrium_linear():
+    """Test symbolic equilibrium for linear demand and supply."""
+    result = market_equilibrium(linear_demand(), linear_supply())
+
+    assert result is not None
+    assert simplify(result["Equilibrium_Price"] - (a - c) / (b + d)) == 0
+    assert simplify(result["Equilibrium_Quantity"] - (a * d + b * c) / (b + d)) == 0
+    assert result["Demand_Type"] == "linear_demand"
+    assert result["Supply_Type"] == "linear_supply"
+
+
+@pytest.mark.market
+def test_market_equilibrium_with_parameters(sample_market_data):
+    """Test numeric equilibrium with parameter substitution."""
+    params = {a: 100, b: 2, c: 20, d: 3}
+    result = market_equilibrium(linear_demand(), linear_supply(), params)
+
+    assert result is not None
+    assert float(result["Equilibrium_Price"]) == pytest.approx(sample_market_data["expected_price"])
+    assert float(result["Equilibrium_Quantity"]) == pytest.approx(sample_market_data["expected_quantity"])
+
+
+@pytest.mark.market
+def test_market_equilibrium_is_memoized():
+    """Test that repeated calls reuse the cached computation but return fresh dicts."""
+    params = {a: 100, b: 2, c: 20, d: 3}
+    first = market_equilibrium(linear_demand(), linear_supply(), params)
+    first["Equilibrium_Price"] = None
+    second = market_equilibrium(linear_demand(), linear_supply(), params)
+
+    assert second["Equilibrium_Price"] == 16
+    assert second["Demand_Equation"] is market_equilibrium(linear_demand(), linear_supply(), params)["Demand_Equation"]
+
+
+@pytest.mark.market
+def test_market_equilibrium_cache_distinguishes_value_types():
+    """Test that int and float parameters, which hash equal, do not share a cache entry."""
+    int_params = {a: 1, b: 2, c: 1, d: 3}
+    float_params = {a: 1.0, b: 2.0, c: 1.0, d: 3.0}
+
+    exact = market_equilibrium(exponential_demand(), linear_supply(), int_params)["Equilibrium_Price"]
+    approx = market_equilibrium(exponential_demand(), linear_supply(), float_params)["Equilibrium_Price"]
+
+    assert isinstance(approx, Float)
+    assert not isinstance(exact, Float)
+    assert float(approx) == pytest.approx(float(exact))
+
+
+@pytest.mark.market
+def test_compile_equilibrium(sample_market_data):
+    """Test that compiled equilibrium functions match the symbolic results."""
+    result = market_equilibrium(linear_demand(), linear_supply())
+    compiled = compile_equilibrium(result)
+
+    assert compiled.symbols == (a, b, c, d)
+    values = (100, 2, 20, 3)
+    assert compiled.functions["Equilibrium_Price"](*values) == pytest.approx(sample_market_data["expected_price"])
+    assert compiled.functions["Equilibrium_Quantity"](*values) == pytest.approx(sample_market_data["expected_quantity"])
+    assert compile_equilibrium(result) is compiled
+
+
+@pytest.mark.market
+def test_market_equilibrium_surpluses():
+    """Test consumer and producer surplus values for the linear case."""
+    params = {a: 100, b: 2, c: 20, d: 3}
+    result = market_equilibrium(linear_demand(), linear_supply(), params)
+
+    assert float(result["Consumer_Surplus"]) == pytest.approx(1156.0)  # 0.5 * 68 * (50 - 16)
+    assert float(result["Producer_Surplus"]) == pytest.approx(16 * 68 - (68**2 / 2 - 20 * 68) / 3)
+    assert float(result["Total_Surplus"]) == pytest.approx(
+        float(result["Consumer_Surplus"] + result["Producer_Surplus"])
+    )
+
+
+@pytest.mark.market
+def test_validate_market_functions():
+    """Test slope validation for symbolic and numeric market functions."""
+    assert validate_market_functions(linear_demand(), linear_supply()) == (True, None)
+    assert validate_market_functions(linear_demand(100, 2), linear_supply(20, 3)) == (True, None)
+
+    valid, message = validate_market_functions(linear_demand(100, -2), linear_supply(20, 3))
+    assert not valid
+    assert message == "Invalid slopes for supply and demand curves"
+
+
+@pytest.mark.market
+def test_market_equilibrium_batch(sample_market_data):
+    """Test batched equilibrium evaluation over a parameter grid."""
+    grid = {a: [100, 200], b: [2], c: [20], d: [3, 4]}
+    values = market_equilibrium_batch(linear_demand(), linear_supply(), grid)
+
+    assert values["Equilibrium_Price"].shape == (2, 1, 1, 2)
+    assert values["Equilibrium_Price"][0, 0, 0, 0] == pytest.approx(sample_market_data["expected_price"])
+    assert values["Equilibrium_Price"][1, 0, 0, 1] == pytest.approx((200 - 20) / (2 + 4))
+    assert values["Equilibrium_Quantity"][0, 0, 0, 0] == pytest.approx(sample_market_data["expected_quantity"])
+
+    scalars = market_equilibrium_batch(linear_demand(), linear_supply(), {a: 100, b: 2, c: [20, 30], d: 3})
+    assert scalars["Equilibrium_Price"].shape == (1, 1, 2, 1)
+    assert scalars["Equilibrium_Price"][0, 0, 0, 0] == pytest.approx(sample_market_data["expected_price"])
+
+    with pytest.raises(ValueError, match="Missing parameter values"):
+        market_equilibrium_batch(linear_demand(), linear_supply(), {a: [100]})
+    with pytest.raises(ValueError, match="bound or not in the model"):
+        market_equilibrium_batch(linear_demand(100, 2), linear_supply(), {c: [1, 2], d: [3], a: [5, 6]})
+
+    bound = market_equilibrium_batch(linear_demand(100, 2), linear_supply(20, 3), {})
+    assert bound["Equilibrium_Price"].shape == ()
+    assert float(bound["Equilibrium_Price"]) == pytest.approx(sample_market_data["expected_price"])
+
+
+@pytest.mark.market
+def test_market_equilibrium_selects_positive_root():
+    """Test that polynomial equilibria pick the positive price root."""
+    numeric = market_equilibrium(quadratic_demand(100, 0.04), linear_supply(0, 3))
+    assert float(numeric["Equilibrium_Price"]) == pytest.approx(25.0)
+    assert float(numeric["Equilibrium_Quantity"]) == pytest.approx(75.0)
+
+    symbolic = market_equilibrium(linear_demand(), quadratic_supply())
+    assert float(symbolic["Equilibrium_Price"].subs({a: 100, b: 2, c: 0, d: 0.04})) > 0
+
+
+@pytest.mark.market
+def test_market_equilibrium_surpluses_are_lazy():
+    """Test that surpluses are only computed when accessed."""
+    result = market_equilibrium(linear_demand(), linear_supply(), {a: 100, b: 2, c: 20, d: 3})
+
+    assert result._compute_surpluses is not None
+    assert "Consumer_Surplus" in result
+    assert float(result["Equilibrium_Price"]) == pytest.approx(16.0)
+    assert result._compute_surpluses is not None
+
+    assert float(result["Consumer_Surplus"]) == pytest.approx(1156.0)
+    assert result._compute_surpluses is None
+    assert set(result) >= {"Consumer_Surplus", "Producer_Surplus", "Total_Surplus"}
+
+
+@pytest.mark.market
+def test_market_equilibrium_lazy_result_behaves_like_dict():
+    """Test that dict methods see the surpluses before they are first read."""
+    params = {a: 100, b: 2, c: 20, d: 3}
+    expected = dict(market_equilibrium(linear_demand(), linear_supply(), params).items())
+
+    result = market_equilibrium(linear_demand(), linear_supply(), params)
+    del result["Consumer_Surplus"]
+    assert "Consumer_Surplus" not in result
+    assert "Total_Surplus" in result
+
+    result = market_equilibrium(linear_demand(), linear_supply(), params)
+    assert result.setdefault("Producer_Surplus", None) == expected["Producer_Surplus"]
+    assert market_equilibrium(linear_demand(), linear_supply(), params).copy() == expected
+    assert {**market_equilibrium(linear_demand(), linear_supply(), params)} == expected
+    assert market_equilibrium(linear_demand(), linear_supply(), params) | {} == expected
+    assert market_equilibrium(linear_demand(), linear_supply(), params) == market_equilibrium(
+        linear_demand(), linear_supply(), params
+    )
+
+    result = market_equilibrium(linear_demand(), linear_supply(), params)
+    result.clear()
+    assert "Consumer_Surplus" not in result and len(result) == 0
+
+
+@pytest.mark.market
+def test_market_equilibrium_closed_form_price():
+    """Test that tabulated equilibrium prices match the solved ones and skip parallel curves."""
+    assert closed_form_price("linear_demand", "linear_supply", a - b * p, c + d * p) == (a - c) / (b + d)
+    assert closed_form_price("linear_demand", "linear_supply", 3 - 2 * p, 1 - 2 * p) is None
+    assert closed_form_price("linear_demand", "quadratic_supply", a - b * p, c + d * p**2) is None
+
+    result = market_equilibrium(power_demand(100, -2), power_supply(10, 3))
+    assert float(result["Equilibrium_Price"]) == pytest.approx(10**0.2)
+    assert float(result["Equilibrium_Quantity"]) == pytest.approx(100 * 10**-0.4)
+
+
+@pytest.mark.market
+def test_closed_form_surplus_float_exponential_intercept():
+    """Test exponential curves still match their formula after SymPy factors out a float constant."""
+    demand_expr = exp(-0.5 * p + 2.5)  # Becomes 12.18*exp(-0.5*p)
+    cs = closed_form_surplus(CS_FORMULAS, "exponential_demand", demand_expr, Float(1.0), exp(2.0))
+    assert cs is not None
+    assert float(cs) == pytest.approx(14.778112197861)
+
+
+@pytest.mark.market
+def test_market_equilibrium_linear_float_params_stay_exact():
+    """Test that float parameters of linear curves give exact rational results."""
+    result = market_equilibrium(linear_demand(), linear_supply(), {a: 100.5, b: 2.5, c: 10.1, d: 3.3})
+
+    assert result["Equilibrium_Price"] == Rational(452, 29)
+    assert isinstance(result["Total_Surplus"], Rational)
+    assert float(result["Equilibrium_Price"]) == pytest.approx((100.5 - 10.1) / (2.5 + 3.3))
+
+
+@pytest.mark.market
+def test_linear_equilibrium_system_from_coefficients():
+    """Test the linear branch solves from coefficients and hands nonlinear input to other solvers."""
+    assert _solve_equilibrium_system("linear_demand", "linear_supply", 100 - 2 * p - (10 + 3 * p)) == [18]
+    assert _solve_equilibrium_system("linear_demand", "linear_supply", 3 - 2 * p - (1 - 2 * p)) == []
+    assert sorted(_solve_equilibrium_system("linear_demand", "linear_supply", 4 - p**2)) == [-2, 2]
+
+
+@pytest.mark.market
+def test_market_equilibrium_batch_special_functions():
+    """Test batch evaluation of equilibria involving LambertW, whose SciPy version returns complex values."""
+    grid = {a: [0.05, 0.1], b: [4.6], c: [1.0], d: [3.0]}
+    batch = market_equilibrium_batch(exponential_demand(), linear_supply(), grid)
+
+    assert batch["Equilibrium_Price"].dtype == float
+    assert batch["Equilibrium_Price"].ravel() == pytest.approx([15.18601007, 10.86036627])
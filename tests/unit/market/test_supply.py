@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-import sympy as sp
+from sympy import exp
 from pyMicroeconomics.market.supply import linear_supply, power_supply, exponential_supply, quadratic_supply
 from pyMicroeconomics.core.symbols import p, q
 
@@ -50,7 +50,7 @@ def test_exponential_supply():
 
     # Test evaluation
     quantity = supply.evaluate(10)
-    expected = sp.exp(0.05 * 10)
+    expected = exp(0.05 * 10)
     assert pytest.approx(quantity) == float(expected)
 
     # Test slope is positive
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+import re
+
+import pytest
+from pyMicroeconomics.market.demand import exponential_demand, linear_demand, power_demand, quadratic_demand
+from pyMicroeconomics.market.supply import exponential_supply, linear_supply, power_supply, quadratic_supply
+from pyMicroeconomics.market.equilibrium import market_equilibrium
+from pyMicroeconomics.visualization import display as display_module
+from pyMicroeconomics.core.symbols import a, b, c, d
+
+
+def _displayed_cells(monkeypatch, result, params):
+    """Render a result and return the contents of its $$...$$ table cells."""
+    shown = []
+    monkeypatch.setattr(display_module, "display", shown.append)
+    display_module.display_equilibrium(result, params)
+    (html,) = shown
+    return re.findall(r"\$\$ (.*?) \$\$", html.data)
+
+
+@pytest.mark.visualization
+def test_display_equilibrium_numeric_values(monkeypatch, sample_market_data):
+    """Test that parameter values turn the price and quantity rows into numbers."""
+    params = {a: 100, b: 2, c: 20, d: 3}
+    cells = _displayed_cells(monkeypatch, market_equilibrium(linear_demand(), linear_supply()), params)
+
+    assert float(cells[0]) == sample_market_data["expected_price"]
+    assert float(cells[1]) == sample_market_data["expected_quantity"]
+    assert cells[2] == "1156.00"
+
+
+@pytest.mark.visualization
+def test_display_equilibrium_lambertw_values(monkeypatch):
+    """Test that values involving LambertW, which the math printer lacks, are still shown as numbers."""
+    params = {a: 10, b: 2, c: 1, d: 3}
+    cells = _displayed_cells(monkeypatch, market_equilibrium(linear_demand(), exponential_supply()), params)
+
+    assert cells[:5] == ["-0.59", "11.17", "31.21", "11.17", "42.38"]
+
+
+@pytest.mark.visualization
+@pytest.mark.parametrize(
+    "demand, supply",
+    [
+        (linear_demand, linear_supply),
+        (power_demand, power_supply),
+        (exponential_demand, exponential_supply),
+        (quadratic_demand, quadratic_supply),
+    ],
+    ids=lambda factory: factory.__name__,
+)
+def test_display_equilibrium_smoke(monkeypatch, demand, supply):
+    """Test each curve family displays a numeric equilibrium price and quantity."""
+    params = {a: 10, b: 2, c: 1, d: 3}
+    price, quantity = _displayed_cells(monkeypatch, market_equilibrium(demand(), supply()), params)[:2]
+
+    assert math.isfinite(float(price)) and math.isfinite(float(quantity))
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from pyMicroeconomics.market.demand import exponential_demand, linear_demand, power_demand, quadratic_demand
+from pyMicroeconomics.market.supply import exponential_supply, linear_supply, power_supply, quadratic_supply
+from pyMicroeconomics.market.equilibrium import market_equilibrium
+from pyMicroeconomics.core.market_base import array_quantity_function
+from pyMicroeconomics.core.symbols import p, a, b, c, d
+from pyMicroeconomics.visualization import plotting
+from pyMicroeconomics.visualization.plotting import (
+    _compile_array_function,
+    _quantity_function,
+    _surplus_vertices,
+    _with_fallback,
+)
+
+CURVE_FAMILIES = [
+    (linear_demand, linear_supply),
+    (power_demand, power_supply),
+    (exponential_demand, exponential_supply),
+    (quadratic_demand, quadratic_supply),
+]
+
+
+class _StubHandle:
+    """Timer handle that records cancellation."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _StubLoop:
+    """Event loop stand-in that holds ``call_later`` callbacks until the test runs them."""
+
+    def __init__(self):
+        self.handles = []
+
+    def call_later(self, delay, callback):
+        self.handles.append(_StubHandle(callback))
+        return self.handles[-1]
+
+    def run_pending(self):
+        handles, self.handles = self.handles, []
+        for handle in handles:
+            if not handle.cancelled:
+                handle.callback()
+
+
+def _plot(monkeypatch, result):
+    """Plot a result, returning everything passed to ``display`` and the sliders by parameter name."""
+    shown = []
+    monkeypatch.setattr(plotting, "display", shown.append)
+    plotting.plot_equilibrium(result, num_points=50)
+    (param_box,) = shown[-1].children[0].children[1:]
+    return shown, {slider.description: slider for slider in param_box.children}
+
+
+@pytest.mark.visualization
+def test_surplus_vertices():
+    """Test the surplus outline follows the curve and closes along the equilibrium price."""
+    vertices = np.empty((5, 2))
+    q_cs = np.array([0.0, 1.0, 2.0])
+    outline = _surplus_vertices(vertices, q_cs, np.array([9.0, 8.0, 7.0]), 5.0)
+
+    assert outline.tolist() == [[0.0, 9.0], [1.0, 8.0], [2.0, 7.0], [2.0, 5.0], [0.0, 5.0]]
+    assert np.shares_memory(outline, vertices)
+    assert _surplus_vertices(vertices, np.array([]), np.array([]), 5.0).shape == (0, 2)
+
+
+@pytest.mark.visualization
+def test_with_fallback_switches_once():
+    """Test the fallback replaces the fast function for good after its first listed error."""
+    calls = []
+
+    def fast(x):
+        calls.append("fast")
+        raise KeyError(x)
+
+    def slow(x):
+        calls.append("slow")
+        return x * 2
+
+    func = _with_fallback(fast, slow, KeyError)
+    assert func(1) == 2
+    assert func(2) == 4
+    assert calls == ["fast", "slow", "slow"]
+
+    with pytest.raises(ZeroDivisionError):
+        _with_fallback(lambda x: 1 / 0, slow, KeyError)(1)
+
+
+@pytest.mark.visualization
+def test_compile_array_function_backend_order(monkeypatch):
+    """Test Numba is preferred over SymEngine, and plain NumPy is used when neither is available or works."""
+    fake_numba = SimpleNamespace(
+        njit=lambda func: lambda *values: "numba",
+        core=SimpleNamespace(errors=SimpleNamespace(NumbaError=RuntimeError)),
+    )
+    fake_symengine = SimpleNamespace(Lambdify=lambda *args, **kwargs: lambda values: "symengine")
+    args, expr = (p, a, b), a - b * p
+    prices = np.array([1.0, 2.0])
+
+    monkeypatch.setattr(plotting, "numba", fake_numba)
+    monkeypatch.setattr(plotting, "symengine", fake_symengine)
+    monkeypatch.setattr(plotting, "numexpr", None)
+    assert _compile_array_function(args, expr)(prices, 100.0, 2.0) == "numba"
+
+    monkeypatch.setattr(plotting, "numba", None)
+    assert _compile_array_function(args, expr)(prices, 100.0, 2.0) == "symengine"
+
+    def unsupported(*args, **kwargs):
+        raise RuntimeError("no LLVM backend")
+
+    monkeypatch.setattr(plotting, "symengine", SimpleNamespace(Lambdify=unsupported))
+    assert _compile_array_function(args, expr)(prices, 100.0, 2.0).tolist() == [98.0, 96.0]
+
+    def failing_jit(func):
+        return lambda *values: unsupported()
+
+    monkeypatch.setattr(plotting, "numba", SimpleNamespace(njit=failing_jit, core=fake_numba.core))
+    assert _compile_array_function(args, expr)(prices, 100.0, 2.0).tolist() == [98.0, 96.0]
+
+
+@pytest.mark.visualization
+def test_quantity_function_maps_parameter_positions():
+    """Test built-in kernels receive their own parameters out of the plot's full argument list."""
+    supply = linear_supply()
+    equation = supply.equation.equation
+    prices = np.array([1.0, 2.0])
+
+    assert array_quantity_function(supply.function_type, equation) is not None
+    kernel = _quantity_function(supply.function_type, equation, (a, b, c, d))
+    generic = _quantity_function("custom_type", equation, (a, b, c, d))
+    assert kernel(prices, 100.0, 2.0, 20.0, 3.0).tolist() == [23.0, 26.0]
+    assert generic(prices, 100.0, 2.0, 20.0, 3.0).tolist() == [23.0, 26.0]
+
+
+@pytest.mark.visualization
+def test_plot_equilibrium_reports_missing_equilibrium(monkeypatch, capsys):
+    """Test parameter values without a real equilibrium report an error instead of drawing NaNs."""
+    # The default slider value c = 0 leaves exponential supply without a real equilibrium
+    _plot(monkeypatch, market_equilibrium(linear_demand(), exponential_supply()))
+
+    assert "No real equilibrium for these parameter values" in capsys.readouterr().out
+
+
+@pytest.mark.visualization
+@pytest.mark.parametrize("demand, supply", CURVE_FAMILIES, ids=lambda factory: factory.__name__)
+def test_plot_equilibrium_smoke(monkeypatch, capsys, demand, supply):
+    """Test each curve family plots with the Agg backend and leaves no pyplot figures open."""
+    shown, sliders = _plot(monkeypatch, market_equilibrium(demand(), supply()))
+    capsys.readouterr()
+    # Without a running event loop, a slider change renders immediately
+    sliders["c"].value = 1.0
+
+    assert "Error" not in capsys.readouterr().out
+    figure = shown[-1]
+    assert isinstance(figure, Figure)
+    text = figure.axes[1].texts[0].get_text()
+    assert "Price: " in text and "nan" not in text
+    figure.canvas.draw()
+    assert not plt.get_fignums()
+
+
+@pytest.mark.visualization
+def test_plot_equilibrium_debounces_slider_changes(monkeypatch):
+    """Test a burst of slider changes renders once, and values back at the last render skip the redraw."""
+    shown, sliders = _plot(monkeypatch, market_equilibrium(linear_demand(), linear_supply()))
+    loop = _StubLoop()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: loop)
+
+    def renders():
+        return sum(isinstance(obj, Figure) for obj in shown)
+
+    assert renders() == 1
+
+    for value in (11.0, 12.0, 13.0):
+        sliders["a"].value = value
+    assert [handle.cancelled for handle in loop.handles] == [True, True, False]
+    assert renders() == 1
+    loop.run_pending()
+    assert renders() == 2
+    assert "Price: 2.60" in shown[-1].axes[1].texts[0].get_text()  # (13 - 0) / (2 + 3)
+
+    sliders["a"].value = 14.0
+    sliders["a"].value = 13.0
+    loop.run_pending()
+    assert renders() == 2